@@ -1,7 +1,7 @@
 import gradio as gr
 from mac_center import MACCenter
 
-# Initialize the MAC Center backend
+# Initialize the MAC Center backend; each browser session holds its own session token
 mac = MACCenter()
 
 # Define the UI functions
@@ -15,22 +15,31 @@ def register(name, email, password, confirm_password, phone_number, address, gen
     success = mac.register(name, email, password, confirm_password, phone_number, address, gender, occupation, portfolio, interests)
     return "Registration successful!" if success else "Registration failed. Check inputs (email unique, passwords match, portfolio valid)."
 
-def login(email, password):
-    success = mac.login(email, password)
-    return "Login successful!" if success else "Login failed. Check email and password."
-
-def logout():
-    success = mac.logout()
-    return "Logged out." if success else "No user logged in."
-
-def view_profile():
-    profile = mac.view_profile()
+async def login(email, password, session, request: gr.Request):
+    source = request.client.host if request and request.client else None
+    # Awaited, so a queued password hash does not hold one of Gradio's worker threads
+    new_session = await mac.create_session_async(email, password, source=source)
+    if new_session is None:
+        # Keep the visitor's current session on a mistyped password
+        return "Login failed. Check email and password.", session
+    if session is not None:
+        mac.logout(session)
+    return "Login successful!", new_session
+
+def logout(session):
+    success = session is not None and mac.logout(session)
+    return ("Logged out." if success else "No user logged in."), None
+
+def view_profile(session):
+    if session is None:
+        return "No user logged in."
+    profile = mac.view_profile(session)
     if profile is None:
         return "No user logged in."
     return f"Profile:\nName: {profile['name']}\nEmail: {profile['email']}\nPhone: {profile['phone_number']}\nAddress: {profile['address']}\nGender: {profile['gender']}\nOccupation: {profile['occupation']}\nPortfolio: {profile['portfolio']}\nInterests: {profile['interests']}\nEnrolled Clubs: {profile['enrolled_clubs']}\nInterested Clubs: {profile['interested_clubs']}"
 
-def edit_profile(name, phone_number, address, gender, occupation, portfolio_str, interests_str):
-    if mac.logged_in_user is None:
+def edit_profile(name, phone_number, address, gender, occupation, portfolio_str, interests_str, session):
+    if session is None or mac.view_profile(session) is None:
         return "No user logged in."
     try:
         portfolio = eval(portfolio_str)
@@ -38,12 +47,15 @@ def edit_profile(name, phone_number, address, gender, occupation, portfolio_str,
     except:
         return "Invalid portfolio format. Use a Python dict like: {'initial_deposit': 1000.0, 'current_value': 1200.0, 'holdings': {'Stock A': 10}}"
     
-    success = mac.edit_profile(name=name, phone_number=phone_number, address=address, gender=gender, occupation=occupation, portfolio=portfolio, interests=interests)
+    success = mac.edit_profile(session, name=name, phone_number=phone_number, address=address, gender=gender, occupation=occupation, portfolio=portfolio, interests=interests)
     return "Profile updated!" if success else "Update failed. Check portfolio format."
 
-def delete_account(password):
-    success = mac.delete_account(password)
-    return "Account deleted." if success else "Deletion failed. Wrong password or no user logged in."
+async def delete_account(password, session, request: gr.Request):
+    source = request.client.host if request and request.client else None
+    success = session is not None and await mac.delete_account_async(password, session, source=source)
+    if success:
+        return "Account deleted.", None
+    return "Deletion failed. Wrong password or no user logged in.", session
 
 def list_all_clubs():
     clubs = mac.list_all_clubs()
@@ -51,56 +63,66 @@ def list_all_clubs():
         return "No clubs available."
     return "\n".join([f"{c['club_id']}: {c['name']} - {c['description']}" for c in clubs])
 
-def enroll_club(club_id):
-    success = mac.enroll_in_club(club_id)
+def enroll_club(club_id, session):
+    success = session is not None and mac.enroll_in_club(club_id, session)
     return f"Enrolled in club {club_id}!" if success else "Enrollment failed. Invalid club ID or already enrolled."
 
-def deenroll_club(club_id):
-    success = mac.deenroll_from_club(club_id)
+def deenroll_club(club_id, session):
+    success = session is not None and mac.deenroll_from_club(club_id, session)
     return f"Deenrolled from club {club_id}!" if success else "Deenrollment failed. Invalid club ID or not enrolled."
 
-def list_enrolled_clubs():
-    clubs = mac.list_enrolled_clubs()
+def list_enrolled_clubs(session):
+    if session is None:
+        return "No user logged in."
+    clubs = mac.list_enrolled_clubs(session)
     if clubs is None:
         return "No user logged in."
     if not clubs:
         return "Not enrolled in any clubs."
     return "\n".join([f"{c['club_id']}: {c['name']}" for c in clubs])
 
-def list_not_enrolled_clubs():
-    clubs = mac.list_not_enrolled_clubs()
+def list_not_enrolled_clubs(session):
+    if session is None:
+        return "No user logged in."
+    clubs = mac.list_not_enrolled_clubs(session)
     if clubs is None:
         return "No user logged in."
     if not clubs:
         return "Enrolled in all clubs."
     return "\n".join([f"{c['club_id']}: {c['name']}" for c in clubs])
 
-def add_interest(club_id):
-    success = mac.add_interest_in_club(club_id)
+def add_interest(club_id, session):
+    success = session is not None and mac.add_interest_in_club(club_id, session)
     return f"Added interest in club {club_id}!" if success else "Failed. Invalid club ID or already interested."
 
-def remove_interest(club_id):
-    success = mac.remove_interest_in_club(club_id)
+def remove_interest(club_id, session):
+    success = session is not None and mac.remove_interest_in_club(club_id, session)
     return f"Removed interest from club {club_id}!" if success else "Failed. Invalid club ID or not interested."
 
-def list_interested_clubs():
-    clubs = mac.list_interested_clubs()
+def list_interested_clubs(session):
+    if session is None:
+        return "No user logged in."
+    clubs = mac.list_interested_clubs(session)
     if clubs is None:
         return "No user logged in."
     if not clubs:
         return "Not interested in any clubs."
     return "\n".join([f"{c['club_id']}: {c['name']}" for c in clubs])
 
-def list_not_interested_clubs():
-    clubs = mac.list_not_interested_clubs()
+def list_not_interested_clubs(session):
+    if session is None:
+        return "No user logged in."
+    clubs = mac.list_not_interested_clubs(session)
     if clubs is None:
         return "No user logged in."
     if not clubs:
         return "Interested in all clubs."
     return "\n".join([f"{c['club_id']}: {c['name']}" for c in clubs])
 
-def portfolio_summary():
-    summary = mac.calculate_portfolio_summary()
+def portfolio_summary(session):
+    if session is None:
+        return "No user logged in."
+    summary = mac.calculate_portfolio_summary(session)
     if summary is None:
         return "No user logged in."
     return f"Total Value: {summary['total_value']}\nProfit/Loss: {summary['profit_loss']}"
@@ -108,6 +130,7 @@ def portfolio_summary():
 # Create the Gradio interface
 with gr.Blocks(title="MAC Center Demo") as demo:
     gr.Markdown("# MAC Center Member Management System")
+    session = gr.State(None)  # session token once this visitor has logged in
     
     with gr.Tab("Register"):
         name = gr.Textbox(label="Name")
@@ -130,13 +153,13 @@ with gr.Blocks(title="MAC Center Demo") as demo:
         login_btn = gr.Button("Login")
         logout_btn = gr.Button("Logout")
         login_output = gr.Textbox(label="Output")
-        login_btn.click(login, inputs=[login_email, login_password], outputs=login_output)
-        logout_btn.click(logout, outputs=login_output)
+        login_btn.click(login, inputs=[login_email, login_password, session], outputs=[login_output, session])
+        logout_btn.click(logout, inputs=[session], outputs=[login_output, session])
     
     with gr.Tab("Profile"):
         view_profile_btn = gr.Button("View Profile")
         profile_output = gr.Textbox(label="Profile", lines=10)
-        view_profile_btn.click(view_profile, outputs=profile_output)
+        view_profile_btn.click(view_profile, inputs=[session], outputs=profile_output)
         
         gr.Markdown("### Edit Profile")
         edit_name = gr.Textbox(label="Name")
@@ -148,13 +171,13 @@ with gr.Blocks(title="MAC Center Demo") as demo:
         edit_interests = gr.Textbox(label="Interests (comma-separated)", value="AI, Finance")
         edit_btn = gr.Button("Update Profile")
         edit_output = gr.Textbox(label="Output")
-        edit_btn.click(edit_profile, inputs=[edit_name, edit_phone, edit_address, edit_gender, edit_occupation, edit_portfolio, edit_interests], outputs=edit_output)
+        edit_btn.click(edit_profile, inputs=[edit_name, edit_phone, edit_address, edit_gender, edit_occupation, edit_portfolio, edit_interests, session], outputs=edit_output)
         
         gr.Markdown("### Delete Account")
         delete_password = gr.Textbox(label="Password", type="password")
         delete_btn = gr.Button("Delete Account")
         delete_output = gr.Textbox(label="Output")
-        delete_btn.click(delete_account, inputs=[delete_password], outputs=delete_output)
+        delete_btn.click(delete_account, inputs=[delete_password, session], outputs=[delete_output, session])
     
     with gr.Tab("Clubs"):
         gr.Markdown("### All Clubs")
@@ -167,41 +190,41 @@ with gr.Blocks(title="MAC Center Demo") as demo:
         enroll_btn = gr.Button("Enroll")
         deenroll_btn = gr.Button("Deenroll")
         enroll_output = gr.Textbox(label="Output")
-        enroll_btn.click(enroll_club, inputs=[club_id_enroll], outputs=enroll_output)
-        deenroll_btn.click(deenroll_club, inputs=[club_id_enroll], outputs=enroll_output)
+        enroll_btn.click(enroll_club, inputs=[club_id_enroll, session], outputs=enroll_output)
+        deenroll_btn.click(deenroll_club, inputs=[club_id_enroll, session], outputs=enroll_output)
         
         gr.Markdown("### Enrolled Clubs")
         enrolled_btn = gr.Button("List Enrolled Clubs")
         enrolled_output = gr.Textbox(label="Enrolled Clubs", lines=5)
-        enrolled_btn.click(list_enrolled_clubs, outputs=enrolled_output)
+        enrolled_btn.click(list_enrolled_clubs, inputs=[session], outputs=enrolled_output)
         
         gr.Markdown("### Not Enrolled Clubs")
         not_enrolled_btn = gr.Button("List Not Enrolled Clubs")
         not_enrolled_output = gr.Textbox(label="Not Enrolled Clubs", lines=5)
-        not_enrolled_btn.click(list_not_enrolled_clubs, outputs=not_enrolled_output)
+        not_enrolled_btn.click(list_not_enrolled_clubs, inputs=[session], outputs=not_enrolled_output)
         
         gr.Markdown("### Interest Management")
         club_id_interest = gr.Textbox(label="Club ID (e.g., club_1)")
         add_interest_btn = gr.Button("Add Interest")
         remove_interest_btn = gr.Button("Remove Interest")
         interest_output = gr.Textbox(label="Output")
-        add_interest_btn.click(add_interest, inputs=[club_id_interest], outputs=interest_output)
-        remove_interest_btn.click(remove_interest, inputs=[club_id_interest], outputs=interest_output)
+        add_interest_btn.click(add_interest, inputs=[club_id_interest, session], outputs=interest_output)
+        remove_interest_btn.click(remove_interest, inputs=[club_id_interest, session], outputs=interest_output)
         
         gr.Markdown("### Interested Clubs")
         interested_btn = gr.Button("List Interested Clubs")
         interested_output = gr.Textbox(label="Interested Clubs", lines=5)
-        interested_btn.click(list_interested_clubs, outputs=interested_output)
+        interested_btn.click(list_interested_clubs, inputs=[session], outputs=interested_output)
         
         gr.Markdown("### Not Interested Clubs")
         not_interested_btn = gr.Button("List Not Interested Clubs")
         not_interested_output = gr.Textbox(label="Not Interested Clubs", lines=5)
-        not_interested_btn.click(list_not_interested_clubs, outputs=not_interested_output)
+        not_interested_btn.click(list_not_interested_clubs, inputs=[session], outputs=not_interested_output)
     
     with gr.Tab("Portfolio"):
         summary_btn = gr.Button("Calculate Portfolio Summary")
         summary_output = gr.Textbox(label="Summary")
-        summary_btn.click(portfolio_summary, outputs=summary_output)
+        summary_btn.click(portfolio_summary, inputs=[session], outputs=summary_output)
 
 # Run the app
 if __name__ == "__main__":
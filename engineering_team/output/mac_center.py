@@ -1,6 +1,33 @@
+import asyncio
 import hashlib
+import hmac
 import json
-from typing import Optional, Dict, List, Tuple, Any
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Optional, Callable, Dict, FrozenSet, List, Mapping, Set, Tuple, Any
+
+# Upper bound on cached club listings (one per distinct set of club IDs).
+LISTING_CACHE_SIZE = 4096
+# Sessions expire after this many idle seconds.
+SESSION_IDLE_TTL = 30 * 60
+# Least recently used sessions are evicted beyond this many.
+MAX_SESSIONS = 10000
+# Fixed salt of the unsalted SHA-256 hashes stored by earlier versions.
+LEGACY_SALT = "mac_center_salt"
+# Failed logins allowed in a burst per email / per source; one more is allowed each refill period.
+EMAIL_LOGIN_BURST = 5
+SOURCE_LOGIN_BURST = 20
+LOGIN_REFILL_SECONDS = 60
+# Upper bound on rate-limited emails or sources tracked at once.
+MAX_RATE_LIMIT_KEYS = 100000
+# Successful logins are remembered this long, so repeat logins skip the KDF.
+CREDENTIAL_CACHE_TTL = 5 * 60
+MAX_CACHED_CREDENTIALS = 10000
 
 
 class Member:
@@ -16,8 +43,9 @@ class Member:
         self.occupation = occupation
         self.portfolio = portfolio
         self.interests = interests
-        self.enrolled_clubs: List[str] = []
-        self.interested_clubs: List[str] = []
+        # Immutable, so they can key the listing cache and be shared safely
+        self.enrolled_clubs: FrozenSet[str] = frozenset()
+        self.interested_clubs: FrozenSet[str] = frozenset()
 
     def update_profile(self, **kwargs) -> bool:
         """Update member attributes."""
@@ -52,12 +80,283 @@ class Club:
         }
 
 
+class PasswordHasher:
+    """
+    Salted password hashing with scrypt or PBKDF2-SHA256 on a bounded thread pool.
+
+    Hashes are stored as "scrypt$n$r$p$salt$hash" or "pbkdf2_sha256$iterations$salt$hash",
+    so they keep verifying after the configuration changes. Both KDFs release the GIL,
+    so at most max_workers hashes use CPU at once while other requests keep running.
+    hash_async() and verify_async() return futures, so async callers need not hold a
+    thread while a hash waits in the queue.
+    Unsalted SHA-256 hashes from earlier versions still verify, and needs_rehash()
+    reports them.
+    """
+    ALGORITHMS = ("scrypt", "pbkdf2_sha256")
+
+    def __init__(self, algorithm: str = "scrypt", iterations: int = 600000, scrypt_n: int = 2 ** 14,
+                 scrypt_r: int = 8, scrypt_p: int = 1, salt_bytes: int = 16, max_workers: int = 4):
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.algorithm = algorithm
+        if algorithm == "scrypt":
+            self.params = (scrypt_n, scrypt_r, scrypt_p)
+        else:
+            self.params = (iterations,)
+        self.salt_bytes = salt_bytes
+        self._prefix = "$".join([algorithm, *map(str, self.params)]) + "$"
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hasher")
+
+    @staticmethod
+    def _derive(algorithm: str, params: Tuple[int, ...], password: str, salt: bytes) -> bytes:
+        if algorithm == "scrypt":
+            n, r, p = params
+            return hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p,
+                                  maxmem=128 * r * (n + p) + 1024 * 1024, dklen=32)
+        (iterations,) = params
+        return hashlib.pbkdf2_hmac("sha256", password.encode(), salt, iterations)
+
+    def _hash(self, password: str) -> str:
+        salt = os.urandom(self.salt_bytes)
+        digest = self._derive(self.algorithm, self.params, password, salt)
+        return f"{self._prefix}{salt.hex()}${digest.hex()}"
+
+    def _verify(self, hashed_password: str, password: str) -> bool:
+        if "$" not in hashed_password:
+            legacy = hashlib.sha256((password + LEGACY_SALT).encode()).hexdigest()
+            return hmac.compare_digest(hashed_password, legacy)
+        try:
+            algorithm, *params, salt, digest = hashed_password.split("$")
+            if algorithm not in self.ALGORITHMS:
+                return False
+            params = tuple(int(param) for param in params)
+            salt_bytes, expected = bytes.fromhex(salt), bytes.fromhex(digest)
+            actual = self._derive(algorithm, params, password, salt_bytes)
+        except ValueError:
+            return False
+        return hmac.compare_digest(actual, expected)
+
+    def hash_async(self, password: str) -> "Future[str]":
+        """Queue hashing a password with a fresh random salt using the configured KDF."""
+        return self._pool.submit(self._hash, password)
+
+    def verify_async(self, hashed_password: str, password: str) -> "Future[bool]":
+        """Queue verifying a password against a stored hash in any supported format."""
+        return self._pool.submit(self._verify, hashed_password, password)
+
+    def hash(self, password: str) -> str:
+        """Hash a password with a fresh random salt using the configured KDF."""
+        return self.hash_async(password).result()
+
+    def verify(self, hashed_password: str, password: str) -> bool:
+        """Verify a password against a stored hash in any supported format."""
+        return self.verify_async(hashed_password, password).result()
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Return True if a stored hash was not made with the current KDF and parameters."""
+        return not hashed_password.startswith(self._prefix)
+
+    def shutdown(self) -> None:
+        """Stop the hashing threads."""
+        self._pool.shutdown()
+
+
+class RateLimiter:
+    """
+    Token buckets of failed attempts per key, e.g. an email or source address.
+
+    Only failures take a token, and allow() only reads the bucket, so rejected
+    traffic costs a dict lookup. Buckets that have refilled are dropped, and the
+    least recently used are evicted beyond max_keys.
+    """
+    def __init__(self, capacity: int = EMAIL_LOGIN_BURST, refill_seconds: float = LOGIN_REFILL_SECONDS,
+                 max_keys: int = MAX_RATE_LIMIT_KEYS, clock: Callable[[], float] = time.monotonic):
+        if capacity < 1 or max_keys < 1:
+            raise ValueError("capacity and max_keys must be at least 1")
+        self.capacity = capacity
+        self.refill_seconds = refill_seconds
+        self.max_keys = max_keys
+        self._clock = clock
+        # key -> (tokens, updated at); least recently used first
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def _tokens(self, key: str, now: float) -> float:
+        """Return the refilled token count for key, dropping buckets that are full again."""
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            return self.capacity
+        tokens = bucket[0] + (now - bucket[1]) / self.refill_seconds
+        if tokens >= self.capacity:
+            del self._buckets[key]
+            return self.capacity
+        return tokens
+
+    def allow(self, key: str) -> bool:
+        """Return True if key has an attempt left."""
+        with self._lock:
+            return self._tokens(key, self._clock()) >= 1
+
+    def record_failure(self, key: str) -> None:
+        """Take one token from key's bucket."""
+        with self._lock:
+            now = self._clock()
+            tokens = max(self._tokens(key, now) - 1, 0.0)
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+
+
+class CredentialCache:
+    """
+    Recently verified passwords, so repeat logins skip the KDF.
+
+    Passwords are kept only as HMACs under a per-process random key, next to
+    the stored hash they were checked against; an entry stops matching once
+    that hash changes.
+    """
+    def __init__(self, ttl: float = CREDENTIAL_CACHE_TTL, max_entries: int = MAX_CACHED_CREDENTIALS,
+                 clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._key = secrets.token_bytes(32)
+        # email -> (stored hash, password HMAC, verified at); least recently used first
+        self._entries: "OrderedDict[str, Tuple[str, bytes, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _digest(self, password: str) -> bytes:
+        return hmac.new(self._key, password.encode(), hashlib.sha256).digest()
+
+    def check(self, email: str, hashed_password: str, password: str) -> bool:
+        """Return True if this password was recently verified against hashed_password."""
+        digest = self._digest(password)
+        with self._lock:
+            entry = self._entries.get(email)
+            if entry is None:
+                return False
+            if entry[0] != hashed_password or self._clock() - entry[2] >= self.ttl:
+                del self._entries[email]
+                return False
+            self._entries.move_to_end(email)
+        return hmac.compare_digest(entry[1], digest)
+
+    def add(self, email: str, hashed_password: str, password: str) -> None:
+        """Remember a successful verification."""
+        digest = self._digest(password)
+        with self._lock:
+            self._entries[email] = (hashed_password, digest, self._clock())
+            self._entries.move_to_end(email)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, email: str) -> None:
+        """Forget a member's cached verification."""
+        with self._lock:
+            self._entries.pop(email, None)
+
+
+class SessionTable:
+    """Session tokens mapped to member emails, with idle expiry and LRU eviction."""
+    def __init__(self, idle_ttl: float = SESSION_IDLE_TTL, max_sessions: int = MAX_SESSIONS,
+                 clock: Callable[[], float] = time.monotonic):
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+        self.idle_ttl = idle_ttl
+        self.max_sessions = max_sessions
+        self._clock = clock
+        # token -> (email, last seen); least recently used first
+        self._sessions: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._tokens_by_email: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _drop(self, token: str) -> None:
+        email, _ = self._sessions.pop(token)
+        tokens = self._tokens_by_email[email]
+        tokens.discard(token)
+        if not tokens:
+            del self._tokens_by_email[email]
+
+    def _expire(self, now: float) -> None:
+        """Drop idle sessions; they sit at the front since every use moves a session to the back."""
+        while self._sessions:
+            token, (_, last_seen) = next(iter(self._sessions.items()))
+            if now - last_seen < self.idle_ttl:
+                break
+            self._drop(token)
+
+    def create(self, email: str) -> str:
+        """Start a session for a member and return its token."""
+        token = secrets.token_urlsafe(32)
+        with self._lock:
+            now = self._clock()
+            self._expire(now)
+            while len(self._sessions) >= self.max_sessions:
+                self._drop(next(iter(self._sessions)))
+            self._sessions[token] = (email, now)
+            self._tokens_by_email.setdefault(email, set()).add(token)
+        return token
+
+    def get(self, token: str) -> Optional[str]:
+        """Return the member email for a live session and refresh it, or None."""
+        with self._lock:
+            entry = self._sessions.get(token)
+            if entry is None:
+                return None
+            now = self._clock()
+            if now - entry[1] >= self.idle_ttl:
+                self._drop(token)
+                return None
+            self._sessions[token] = (entry[0], now)
+            self._sessions.move_to_end(token)
+            return entry[0]
+
+    def end(self, token: str) -> bool:
+        """End one session."""
+        with self._lock:
+            if token not in self._sessions:
+                return False
+            self._drop(token)
+            return True
+
+    def end_all(self, email: str) -> None:
+        """End every session of a member."""
+        with self._lock:
+            for token in list(self._tokens_by_email.get(email, ())):
+                self._drop(token)
+
+
 class MACCenter:
     """Main class for MAC Center member management system."""
-    def __init__(self):
+    def __init__(self, sessions: Optional[SessionTable] = None, hasher: Optional[PasswordHasher] = None,
+                 email_limiter: Optional[RateLimiter] = None, source_limiter: Optional[RateLimiter] = None,
+                 credential_cache: Optional[CredentialCache] = None):
         self.members: Dict[str, Member] = {}
         self.clubs: Dict[str, Club] = {}
+        # Reverse indexes: club_id -> emails of enrolled / interested members
+        self.club_members: Dict[str, Set[str]] = {}
+        self.club_interested: Dict[str, Set[str]] = {}
+        # Read-only club dicts in catalog order, shared by every listing
+        self._club_views: Tuple[Mapping[str, str], ...] = ()
+        self._listing_cache: Dict[Tuple[FrozenSet[str], bool], Tuple[Mapping[str, str], ...]] = {}
+        # Single-user mode used by login()/logout(); create_session() serves many members
         self.logged_in_user: Optional[str] = None
+        self.sessions = sessions if sessions is not None else SessionTable()
+        self._owns_hasher = hasher is None
+        self.hasher = hasher if hasher is not None else PasswordHasher()
+        self.email_limiter = email_limiter if email_limiter is not None else RateLimiter()
+        self.source_limiter = (source_limiter if source_limiter is not None
+                               else RateLimiter(capacity=SOURCE_LOGIN_BURST))
+        self.credential_cache = credential_cache if credential_cache is not None else CredentialCache()
         self._initialize_clubs()
 
     def _initialize_clubs(self):
@@ -78,15 +377,69 @@ class MACCenter:
         ]
         for club_id, name, description in clubs_data:
             self.clubs[club_id] = Club(club_id, name, description)
+            self.club_members[club_id] = set()
+            self.club_interested[club_id] = set()
+        self._club_views = tuple(MappingProxyType(club.to_dict()) for club in self.clubs.values())
 
     def _hash_password(self, password: str) -> str:
-        """Hash a password using SHA-256 with a simple salt."""
-        salt = "mac_center_salt"
-        return hashlib.sha256((password + salt).encode()).hexdigest()
+        """Hash a password with a per-user salt using the configured KDF."""
+        return self.hasher.hash(password)
 
     def _verify_password(self, hashed_password: str, password: str) -> bool:
         """Verify a password against its hash."""
-        return hashed_password == self._hash_password(password)
+        return self.hasher.verify(hashed_password, password)
+
+    def _check_login(self, member: Member, password: str) -> bool:
+        """Verify a member's password, upgrading an outdated hash once it matches."""
+        if self.credential_cache.check(member.email, member.password, password):
+            return True
+        if not self._verify_password(member.password, password):
+            return False
+        if self.hasher.needs_rehash(member.password):
+            member.password = self._hash_password(password)
+        self.credential_cache.add(member.email, member.password, password)
+        return True
+
+    async def _check_login_async(self, member: Member, password: str) -> bool:
+        """Like _check_login, but awaits the hashing pool instead of blocking the calling thread."""
+        if self.credential_cache.check(member.email, member.password, password):
+            return True
+        if not await asyncio.wrap_future(self.hasher.verify_async(member.password, password)):
+            return False
+        if self.hasher.needs_rehash(member.password):
+            member.password = await asyncio.wrap_future(self.hasher.hash_async(password))
+        self.credential_cache.add(member.email, member.password, password)
+        return True
+
+    def _throttled(self, email: str, source: Optional[str]) -> bool:
+        """Return True if the email or source has no login attempts left."""
+        return not self.email_limiter.allow(email) or (source is not None and not self.source_limiter.allow(source))
+
+    def _record_login_failure(self, email: str, source: Optional[str]) -> None:
+        """Take a login attempt from the email and source."""
+        self.email_limiter.record_failure(email)
+        if source is not None:
+            self.source_limiter.record_failure(source)
+
+    def _authenticate(self, email: str, password: str, source: Optional[str]) -> Optional[Member]:
+        """Return the member if the password matches, rejecting throttled emails and sources before hashing."""
+        if self._throttled(email, source):
+            return None
+        member = self.members.get(email)
+        if member is None or not self._check_login(member, password):
+            self._record_login_failure(email, source)
+            return None
+        return member
+
+    async def _authenticate_async(self, email: str, password: str, source: Optional[str]) -> Optional[Member]:
+        """Like _authenticate, but awaits the hashing pool instead of blocking the calling thread."""
+        if self._throttled(email, source):
+            return None
+        member = self.members.get(email)
+        if member is None or not await self._check_login_async(member, password):
+            self._record_login_failure(email, source)
+            return None
+        return member
 
     def _validate_email(self, email: str) -> bool:
         """Validate email format and uniqueness."""
@@ -111,10 +464,32 @@ class MACCenter:
             return False
         return True
 
+    def _current_member(self, session: Optional[str]) -> Optional[Member]:
+        """Return the member for a session token, or the logged-in user when no token is given."""
+        email = self.logged_in_user if session is None else self.sessions.get(session)
+        if email is None:
+            return None
+        return self.members.get(email)
+
     def _get_club_by_id(self, club_id: str) -> Optional[Club]:
         """Return Club object by ID."""
         return self.clubs.get(club_id)
 
+    def _ordered_club_ids(self, club_ids: FrozenSet[str]) -> List[str]:
+        """Return the given club IDs in catalog order."""
+        return [club_id for club_id in self.clubs if club_id in club_ids]
+
+    def _club_listing(self, club_ids: FrozenSet[str], included: bool) -> List[Mapping[str, str]]:
+        """Return the cached club views that are (or are not) in club_ids, in catalog order."""
+        key = (club_ids, included)
+        listing = self._listing_cache.get(key)
+        if listing is None:
+            if len(self._listing_cache) >= LISTING_CACHE_SIZE:
+                self._listing_cache.clear()
+            listing = tuple(view for view in self._club_views if (view['club_id'] in club_ids) == included)
+            self._listing_cache[key] = listing
+        return list(listing)
+
     def register(self, name: str, email: str, password: str, confirm_password: str,
                  phone_number: str, address: str, gender: str, occupation: str,
                  portfolio: dict, interests: list) -> bool:
@@ -132,28 +507,39 @@ class MACCenter:
         self.members[email] = new_member
         return True
 
-    def login(self, email: str, password: str) -> bool:
-        """Log in a member."""
-        if email not in self.members:
+    def login(self, email: str, password: str, source: Optional[str] = None) -> bool:
+        """Log in a member; source (e.g. the client address) is rate limited alongside the email."""
+        if self._authenticate(email, password, source) is None:
             return False
-        member = self.members[email]
-        if self._verify_password(member.password, password):
-            self.logged_in_user = email
-            return True
-        return False
+        self.logged_in_user = email
+        return True
 
-    def logout(self) -> bool:
-        """Log out the current user."""
+    def logout(self, session: Optional[str] = None) -> bool:
+        """Log out the current user, or end the given session."""
+        if session is not None:
+            return self.sessions.end(session)
         if self.logged_in_user is None:
             return False
         self.logged_in_user = None
         return True
 
-    def view_profile(self) -> Optional[dict]:
+    def create_session(self, email: str, password: str, source: Optional[str] = None) -> Optional[str]:
+        """Log in a member and return a session token for the other methods, or None."""
+        if self._authenticate(email, password, source) is None:
+            return None
+        return self.sessions.create(email)
+
+    async def create_session_async(self, email: str, password: str, source: Optional[str] = None) -> Optional[str]:
+        """Like create_session, but awaits password hashing instead of holding the calling thread."""
+        if await self._authenticate_async(email, password, source) is None:
+            return None
+        return self.sessions.create(email)
+
+    def view_profile(self, session: Optional[str] = None) -> Optional[dict]:
         """Return the profile of the logged-in user."""
-        if self.logged_in_user is None:
+        member = self._current_member(session)
+        if member is None:
             return None
-        member = self.members[self.logged_in_user]
         return {
             'name': member.name,
             'email': member.email,
@@ -163,15 +549,15 @@ class MACCenter:
             'occupation': member.occupation,
             'portfolio': member.portfolio,
             'interests': member.interests,
-            'enrolled_clubs': member.enrolled_clubs,
-            'interested_clubs': member.interested_clubs
+            'enrolled_clubs': self._ordered_club_ids(member.enrolled_clubs),
+            'interested_clubs': self._ordered_club_ids(member.interested_clubs)
         }
 
-    def edit_profile(self, **kwargs) -> bool:
+    def edit_profile(self, session: Optional[str] = None, **kwargs) -> bool:
         """Update the profile of the logged-in user."""
-        if self.logged_in_user is None:
+        member = self._current_member(session)
+        if member is None:
             return False
-        member = self.members[self.logged_in_user]
         # Prevent editing email and password via this method
         if 'email' in kwargs or 'password' in kwargs:
             return False
@@ -179,124 +565,165 @@ class MACCenter:
             return False
         return member.update_profile(**kwargs)
 
-    def delete_account(self, password: str) -> bool:
-        """Delete the account of the logged-in user."""
-        if self.logged_in_user is None:
+    def delete_account(self, password: str, session: Optional[str] = None, source: Optional[str] = None) -> bool:
+        """Delete the account of the logged-in user; wrong passwords are rate limited like logins."""
+        member = self._current_member(session)
+        if member is None:
             return False
-        member = self.members[self.logged_in_user]
-        if not self._verify_password(member.password, password):
+        if self._authenticate(member.email, password, source) is None:
             return False
-        del self.members[self.logged_in_user]
-        self.logged_in_user = None
+        self._remove_member(member)
         return True
 
-    def list_all_clubs(self) -> List[dict]:
-        """Return a list of all clubs."""
-        return [club.to_dict() for club in self.clubs.values()]
+    async def delete_account_async(self, password: str, session: Optional[str] = None,
+                                   source: Optional[str] = None) -> bool:
+        """Like delete_account, but awaits password hashing instead of holding the calling thread."""
+        member = self._current_member(session)
+        if member is None:
+            return False
+        if await self._authenticate_async(member.email, password, source) is None:
+            return False
+        self._remove_member(member)
+        return True
 
-    def enroll_in_club(self, club_id: str) -> bool:
+    def _remove_member(self, member: Member) -> None:
+        """Drop a member from the indexes, sessions and credential cache."""
+        for club_id in member.enrolled_clubs:
+            self.club_members[club_id].discard(member.email)
+        for club_id in member.interested_clubs:
+            self.club_interested[club_id].discard(member.email)
+        del self.members[member.email]
+        self.sessions.end_all(member.email)
+        self.credential_cache.discard(member.email)
+        if self.logged_in_user == member.email:
+            self.logged_in_user = None
+
+    def list_all_clubs(self) -> List[Mapping[str, str]]:
+        """Return a list of all clubs, as shared read-only dicts."""
+        return list(self._club_views)
+
+    def enroll_in_club(self, club_id: str, session: Optional[str] = None) -> bool:
         """Enroll the logged-in user in a club."""
-        if self.logged_in_user is None:
+        member = self._current_member(session)
+        if member is None:
             return False
         club = self._get_club_by_id(club_id)
         if club is None:
             return False
-        member = self.members[self.logged_in_user]
         if club_id in member.enrolled_clubs:
             return False
-        member.enrolled_clubs.append(club_id)
+        member.enrolled_clubs = member.enrolled_clubs | {club_id}
+        self.club_members[club_id].add(member.email)
         return True
 
-    def deenroll_from_club(self, club_id: str) -> bool:
+    def deenroll_from_club(self, club_id: str, session: Optional[str] = None) -> bool:
         """Remove the logged-in user from a club."""
-        if self.logged_in_user is None:
+        member = self._current_member(session)
+        if member is None:
             return False
         club = self._get_club_by_id(club_id)
         if club is None:
             return False
-        member = self.members[self.logged_in_user]
         if club_id not in member.enrolled_clubs:
             return False
-        member.enrolled_clubs.remove(club_id)
+        member.enrolled_clubs = member.enrolled_clubs - {club_id}
+        self.club_members[club_id].discard(member.email)
         return True
 
-    def list_enrolled_clubs(self) -> Optional[List[dict]]:
+    def list_enrolled_clubs(self, session: Optional[str] = None) -> Optional[List[Mapping[str, str]]]:
         """Return clubs the logged-in user is enrolled in."""
-        if self.logged_in_user is None:
+        member = self._current_member(session)
+        if member is None:
             return None
-        member = self.members[self.logged_in_user]
-        enrolled = []
-        for club_id in member.enrolled_clubs:
-            club = self._get_club_by_id(club_id)
-            if club:
-                enrolled.append(club.to_dict())
-        return enrolled
+        return self._club_listing(member.enrolled_clubs, True)
 
-    def list_not_enrolled_clubs(self) -> Optional[List[dict]]:
+    def list_not_enrolled_clubs(self, session: Optional[str] = None) -> Optional[List[Mapping[str, str]]]:
         """Return clubs the logged-in user is not enrolled in."""
-        if self.logged_in_user is None:
+        member = self._current_member(session)
+        if member is None:
             return None
-        member = self.members[self.logged_in_user]
-        not_enrolled = []
-        for club_id, club in self.clubs.items():
-            if club_id not in member.enrolled_clubs:
-                not_enrolled.append(club.to_dict())
-        return not_enrolled
-
-    def add_interest_in_club(self, club_id: str) -> bool:
+        return self._club_listing(member.enrolled_clubs, False)
+
+    def add_interest_in_club(self, club_id: str, session: Optional[str] = None) -> bool:
         """Add a club to the logged-in user's interested clubs."""
-        if self.logged_in_user is None:
+        member = self._current_member(session)
+        if member is None:
             return False
         club = self._get_club_by_id(club_id)
         if club is None:
             return False
-        member = self.members[self.logged_in_user]
         if club_id in member.interested_clubs:
             return False
-        member.interested_clubs.append(club_id)
+        member.interested_clubs = member.interested_clubs | {club_id}
+        self.club_interested[club_id].add(member.email)
         return True
 
-    def remove_interest_in_club(self, club_id: str) -> bool:
+    def remove_interest_in_club(self, club_id: str, session: Optional[str] = None) -> bool:
         """Remove a club from the logged-in user's interested clubs."""
-        if self.logged_in_user is None:
+        member = self._current_member(session)
+        if member is None:
             return False
         club = self._get_club_by_id(club_id)
         if club is None:
             return False
-        member = self.members[self.logged_in_user]
         if club_id not in member.interested_clubs:
             return False
-        member.interested_clubs.remove(club_id)
+        member.interested_clubs = member.interested_clubs - {club_id}
+        self.club_interested[club_id].discard(member.email)
         return True
 
-    def list_interested_clubs(self) -> Optional[List[dict]]:
+    def list_interested_clubs(self, session: Optional[str] = None) -> Optional[List[Mapping[str, str]]]:
         """Return clubs the logged-in user is interested in."""
-        if self.logged_in_user is None:
+        member = self._current_member(session)
+        if member is None:
             return None
-        member = self.members[self.logged_in_user]
-        interested = []
-        for club_id in member.interested_clubs:
-            club = self._get_club_by_id(club_id)
-            if club:
-                interested.append(club.to_dict())
-        return interested
+        return self._club_listing(member.interested_clubs, True)
 
-    def list_not_interested_clubs(self) -> Optional[List[dict]]:
+    def list_not_interested_clubs(self, session: Optional[str] = None) -> Optional[List[Mapping[str, str]]]:
         """Return clubs the logged-in user is not interested in."""
-        if self.logged_in_user is None:
+        member = self._current_member(session)
+        if member is None:
+            return None
+        return self._club_listing(member.interested_clubs, False)
+
+    def list_club_members(self, club_id: str) -> Optional[List[str]]:
+        """Return the emails of members enrolled in a club, or None for an unknown club."""
+        members = self.club_members.get(club_id)
+        if members is None:
+            return None
+        return sorted(members)
+
+    def count_club_members(self, club_id: str) -> Optional[int]:
+        """Return the number of members enrolled in a club, or None for an unknown club."""
+        members = self.club_members.get(club_id)
+        if members is None:
+            return None
+        return len(members)
+
+    def list_interested_members(self, club_id: str) -> Optional[List[str]]:
+        """Return the emails of members interested in a club, or None for an unknown club."""
+        members = self.club_interested.get(club_id)
+        if members is None:
+            return None
+        return sorted(members)
+
+    def count_interested_members(self, club_id: str) -> Optional[int]:
+        """Return the number of members interested in a club, or None for an unknown club."""
+        members = self.club_interested.get(club_id)
+        if members is None:
             return None
-        member = self.members[self.logged_in_user]
-        not_interested = []
-        for club_id, club in self.clubs.items():
-            if club_id not in member.interested_clubs:
-                not_interested.append(club.to_dict())
-        return not_interested
-
-    def calculate_portfolio_summary(self) -> Optional[dict]:
+        return len(members)
+
+    def close(self) -> None:
+        """Stop the password hashing threads, unless the hasher was passed in."""
+        if self._owns_hasher:
+            self.hasher.shutdown()
+
+    def calculate_portfolio_summary(self, session: Optional[str] = None) -> Optional[dict]:
         """Calculate portfolio summary for the logged-in user."""
-        if self.logged_in_user is None:
+        member = self._current_member(session)
+        if member is None:
             return None
-        member = self.members[self.logged_in_user]
         total_value, profit_loss = member.calculate_portfolio_summary()
         return {
             'total_value': total_value,
@@ -3,8 +3,11 @@ The error indicates that the `mac_center` module is not found. When testing this
 Below is the raw Python code for `test_mac_center.py` which contains the unit tests for the `mac_center` module. Please make sure that this file is in the same directory as the `mac_center.py`.
 
 ```python
+import asyncio
+import hashlib
 import unittest
-from mac_center import Member, Club, MACCenter
+from unittest import mock
+from mac_center import Member, Club, MACCenter, PasswordHasher, RateLimiter, SessionTable
 
 class TestMember(unittest.TestCase):
     def setUp(self):
@@ -65,6 +68,9 @@ class TestMACCenter(unittest.TestCase):
             interests=["AI", "Finance"]
         )
 
+    def tearDown(self):
+        self.mac.close()
+
     def test_register(self):
         result = self.mac.register(
             name="Jane Doe",
@@ -164,6 +170,158 @@ class TestMACCenter(unittest.TestCase):
         self.assertEqual(summary['total_value'], 1200.0)
         self.assertEqual(summary['profit_loss'], 200.0)
 
+    def test_club_rosters(self):
+        self.mac.register(
+            name="Jane Doe", email="jane@example.com", password="pass456", confirm_password="pass456",
+            phone_number="0987654321", address="124 Main St", gender="Female", occupation="Scientist",
+            portfolio=self.portfolio, interests=["AI"]
+        )
+        self.mac.login("john@example.com", "pass123")
+        self.mac.enroll_in_club("club_2")
+        self.mac.add_interest_in_club("club_3")
+        self.mac.login("jane@example.com", "pass456")
+        self.mac.enroll_in_club("club_2")
+        self.assertEqual(self.mac.list_club_members("club_2"), ["jane@example.com", "john@example.com"])
+        self.assertEqual(self.mac.count_club_members("club_2"), 2)
+        self.assertEqual(self.mac.list_interested_members("club_3"), ["john@example.com"])
+        self.mac.deenroll_from_club("club_2")
+        self.assertEqual(self.mac.count_club_members("club_2"), 1)
+        self.mac.login("john@example.com", "pass123")
+        self.mac.delete_account(password="pass123")
+        self.assertEqual(self.mac.count_club_members("club_2"), 0)
+        self.assertEqual(self.mac.count_interested_members("club_3"), 0)
+        self.assertIsNone(self.mac.list_club_members("club_99"))
+
+    def test_club_listings_share_cached_views(self):
+        self.mac.login("john@example.com", "pass123")
+        self.mac.enroll_in_club("club_5")
+        self.mac.enroll_in_club("club_2")
+        enrolled = self.mac.list_enrolled_clubs()
+        self.assertEqual([c['club_id'] for c in enrolled], ["club_2", "club_5"])
+        not_enrolled = self.mac.list_not_enrolled_clubs()
+        self.assertNotIn("club_2", [c['club_id'] for c in not_enrolled])
+        self.assertIs(enrolled[0], self.mac.list_all_clubs()[1])
+        self.assertIs(self.mac.list_enrolled_clubs()[0], enrolled[0])
+        with self.assertRaises(TypeError):
+            enrolled[0]['name'] = "Renamed"
+        self.assertEqual(self.mac.view_profile()['enrolled_clubs'], ["club_2", "club_5"])
+
+    def test_sessions(self):
+        self.mac.register(
+            name="Jane Doe", email="jane@example.com", password="pass456", confirm_password="pass456",
+            phone_number="0987654321", address="124 Main St", gender="Female", occupation="Scientist",
+            portfolio=self.portfolio, interests=["AI"]
+        )
+        john = self.mac.create_session("john@example.com", "pass123")
+        jane = self.mac.create_session("jane@example.com", "pass456")
+        self.assertIsNone(self.mac.create_session("john@example.com", "wrongpass"))
+        self.assertTrue(self.mac.enroll_in_club("club_2", session=john))
+        self.assertEqual(self.mac.view_profile(session=jane)['name'], "Jane Doe")
+        self.assertEqual(len(self.mac.list_enrolled_clubs(session=jane)), 0)
+        self.assertTrue(self.mac.edit_profile(session=jane, phone_number="1111111111"))
+        self.assertIsNone(self.mac.view_profile())
+        self.assertTrue(self.mac.logout(session=jane))
+        self.assertIsNone(self.mac.view_profile(session=jane))
+        self.assertTrue(self.mac.delete_account("pass123", session=john))
+        self.assertIsNone(self.mac.view_profile(session=john))
+        self.assertIsNone(self.mac.view_profile(session="not-a-token"))
+
+    def test_session_expiry_and_eviction(self):
+        now = [0.0]
+        sessions = SessionTable(idle_ttl=60, max_sessions=2, clock=lambda: now[0])
+        first = sessions.create("a@example.com")
+        second = sessions.create("b@example.com")
+        now[0] = 30
+        self.assertEqual(sessions.get(first), "a@example.com")
+        sessions.create("c@example.com")
+        self.assertIsNone(sessions.get(second))
+        self.assertEqual(len(sessions), 2)
+        now[0] = 100
+        self.assertIsNone(sessions.get(first))
+
+    def test_password_hashes_are_salted(self):
+        stored = self.mac.members["john@example.com"].password
+        self.assertTrue(stored.startswith("scrypt$"))
+        self.mac.register(
+            name="Jane Doe", email="jane@example.com", password="pass123", confirm_password="pass123",
+            phone_number="0987654321", address="124 Main St", gender="Female", occupation="Scientist",
+            portfolio=self.portfolio, interests=["AI"]
+        )
+        self.assertNotEqual(self.mac.members["jane@example.com"].password, stored)
+
+    def test_legacy_hash_is_upgraded_on_login(self):
+        member = self.mac.members["john@example.com"]
+        member.password = hashlib.sha256(("pass123" + "mac_center_salt").encode()).hexdigest()
+        self.assertFalse(self.mac.login("john@example.com", "wrongpass"))
+        self.assertNotIn("$", member.password)
+        self.assertTrue(self.mac.login("john@example.com", "pass123"))
+        self.assertTrue(member.password.startswith("scrypt$"))
+        self.assertTrue(self.mac.login("john@example.com", "pass123"))
+
+    def test_async_login_and_delete(self):
+        async def run():
+            session = await self.mac.create_session_async("john@example.com", "pass123")
+            self.assertIsNotNone(session)
+            self.assertIsNone(await self.mac.create_session_async("john@example.com", "wrongpass"))
+            self.assertFalse(await self.mac.delete_account_async("wrongpass", session))
+            self.assertTrue(await self.mac.delete_account_async("pass123", session))
+        asyncio.run(run())
+        self.assertNotIn("john@example.com", self.mac.members)
+
+    def test_pbkdf2_hasher(self):
+        hasher = PasswordHasher(algorithm="pbkdf2_sha256", iterations=1000, max_workers=1)
+        stored = hasher.hash("pass123")
+        self.assertTrue(stored.startswith("pbkdf2_sha256$1000$"))
+        self.assertTrue(hasher.verify(stored, "pass123"))
+        self.assertFalse(hasher.verify(stored, "wrongpass"))
+        self.assertTrue(hasher.verify_async(stored, "pass123").result())
+        self.assertFalse(hasher.needs_rehash(stored))
+        self.assertTrue(PasswordHasher(algorithm="pbkdf2_sha256", iterations=2000).needs_rehash(stored))
+        self.assertFalse(hasher.verify("pbkdf2_sha256$1000$zz$zz", "pass123"))
+        with self.assertRaises(ValueError):
+            PasswordHasher(algorithm="md5")
+        hasher.shutdown()
+
+    def test_failed_logins_are_rate_limited(self):
+        now = [0.0]
+        self.mac.email_limiter = RateLimiter(capacity=3, refill_seconds=60, clock=lambda: now[0])
+        for _ in range(3):
+            self.assertFalse(self.mac.login("john@example.com", "wrongpass"))
+        with mock.patch.object(self.mac.hasher, "verify", side_effect=AssertionError("hashed")):
+            self.assertFalse(self.mac.login("john@example.com", "pass123"))
+        now[0] = 60
+        self.assertTrue(self.mac.login("john@example.com", "pass123"))
+
+    def test_failed_logins_are_rate_limited_per_source(self):
+        self.mac.source_limiter = RateLimiter(capacity=2)
+        self.assertIsNone(self.mac.create_session("nobody@example.com", "x", source="10.0.0.1"))
+        self.assertIsNone(self.mac.create_session("other@example.com", "x", source="10.0.0.1"))
+        self.assertIsNone(self.mac.create_session("john@example.com", "pass123", source="10.0.0.1"))
+        self.assertIsNotNone(self.mac.create_session("john@example.com", "pass123", source="10.0.0.2"))
+
+    def test_rate_limiter_evicts_least_recently_used(self):
+        limiter = RateLimiter(capacity=1, max_keys=2)
+        for key in ("a", "b", "c"):
+            limiter.record_failure(key)
+        self.assertEqual(len(limiter), 2)
+        self.assertTrue(limiter.allow("a"))
+        self.assertFalse(limiter.allow("c"))
+
+    def test_repeat_login_skips_hashing(self):
+        self.assertTrue(self.mac.login("john@example.com", "pass123"))
+        with mock.patch.object(self.mac.hasher, "verify", side_effect=AssertionError("hashed")):
+            self.assertTrue(self.mac.login("john@example.com", "pass123"))
+        self.assertFalse(self.mac.login("john@example.com", "wrongpass"))
+
+    def test_failed_account_deletions_are_rate_limited(self):
+        self.mac.email_limiter = RateLimiter(capacity=2)
+        self.mac.login("john@example.com", "pass123")
+        self.assertFalse(self.mac.delete_account("wrongpass"))
+        self.assertFalse(self.mac.delete_account("wrongpass"))
+        with mock.patch.object(self.mac.hasher, "verify", side_effect=AssertionError("hashed")):
+            self.assertFalse(self.mac.delete_account("pass123"))
+        self.assertIn("john@example.com", self.mac.members)
+
 if __name__ == '__main__':
     unittest.main()
 ```
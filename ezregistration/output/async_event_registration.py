@@ -0,0 +1,170 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Optional, List, Tuple, Dict, Any, Callable, Iterable, Mapping, Sequence, Union
+
+from event_registration import EventRegistration
+from registration_models import Event, User
+from registration_pagination import Page
+
+
+class AsyncEventRegistration:
+    """
+    asyncio facade over a thread-safe EventRegistration, for ASGI apps.
+
+    Storage calls never run on the event loop. Reads go to a small thread pool;
+    writes go to a single writer thread, so they reach storage (and the journal)
+    one at a time without contending for locks. Concurrent register calls are
+    group-committed: while one batch is being written, new requests queue up and
+    are then written together with bulk_register, as one journal record and one
+    storage transaction, with the same per-request results as registering one
+    at a time.
+
+    An instance must be used from a single event loop.
+    """
+
+    def __init__(self, backend: Optional[EventRegistration] = None, readers: int = 8,
+                 max_batch: int = 512):
+        """
+        Wrap a backend.
+
+        Args:
+            backend (EventRegistration | None): Backend created with thread_safe=True,
+                defaults to a new in-memory one
+            readers (int): Number of threads serving reads
+            max_batch (int): Maximum number of registrations committed together
+        """
+        if backend is None:
+            backend = EventRegistration(thread_safe=True)
+        elif not backend.thread_safe:
+            raise ValueError("AsyncEventRegistration needs a backend created with thread_safe=True")
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self.backend = backend
+        self.max_batch = max_batch
+        self._readers = ThreadPoolExecutor(max_workers=readers, thread_name_prefix="registration-reader")
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="registration-writer")
+        self._pending: List[Tuple[Tuple[Any, str, str, str], asyncio.Future]] = []
+        self._drain_task: Optional[asyncio.Task] = None
+
+    async def _read(self, method: Callable, *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self._readers, method, *args)
+
+    async def _write(self, method: Callable, *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self._writer, method, *args)
+
+    async def _drain(self) -> None:
+        """Write queued registrations in batches until the queue is empty."""
+        try:
+            while self._pending:
+                batch = self._pending[:self.max_batch]
+                del self._pending[:self.max_batch]
+                try:
+                    results = await self._write(self.backend.bulk_register, [row for row, _ in batch])
+                except Exception as exc:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(exc)
+                    continue
+                for (_, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+        finally:
+            self._drain_task = None
+
+    # Registration and account management
+
+    async def register_user_for_event(self, event_id: int, name: str, email: str,
+                                      phone: str) -> Tuple[bool, str, int]:
+        """
+        Register a user for an event; see EventRegistration.register_user_for_event.
+
+        Returns:
+            tuple[bool, str, int]: Success status, message and user ID (-1 on failure)
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append(((event_id, name, email, phone), future))
+        if self._drain_task is None:
+            self._drain_task = loop.create_task(self._drain())
+        return await future
+
+    async def bulk_register(self, rows: Iterable[Union[Mapping[str, Any], Sequence[Any]]]) -> List[Tuple[bool, str, int]]:
+        """Register many users at once; see EventRegistration.bulk_register."""
+        return await self._write(self.backend.bulk_register, list(rows))
+
+    async def delete_user_account(self, user_id: int) -> Tuple[bool, str]:
+        """Delete a user account; see EventRegistration.delete_user_account."""
+        return await self._write(self.backend.delete_user_account, user_id)
+
+    async def create_event(self, name: str, description: str, date: str, time: str, location: str,
+                           capacity: Optional[int] = None) -> Event:
+        """Create an event; see EventRegistration.create_event."""
+        return await self._write(self.backend.create_event, name, description, date, time, location, capacity)
+
+    # Listings
+
+    async def get_all_events(self) -> List[Event]:
+        """Retrieve all events sorted by date."""
+        return await self._read(self.backend.get_all_events)
+
+    async def get_events_page(self, limit: int = 20, cursor: Optional[str] = None) -> Page[Event]:
+        """Retrieve one page of events; see EventRegistration.get_events_page."""
+        return await self._read(self.backend.get_events_page, limit, cursor)
+
+    async def get_event_by_id(self, event_id: int) -> Optional[Event]:
+        """Get an event by ID, or None if it doesn't exist."""
+        return await self._read(self.backend.get_event_by_id, event_id)
+
+    async def get_upcoming_events(self, days: int = 7, now: Optional[datetime] = None) -> List[Event]:
+        """Retrieve events starting within the next ``days`` days."""
+        return await self._read(self.backend.get_upcoming_events, days, now)
+
+    async def search_events(self, query: str, limit: int = 10) -> List[Event]:
+        """Search events by keyword; see EventRegistration.search_events."""
+        return await self._read(self.backend.search_events, query, limit)
+
+    async def find_user_by_email(self, email: str) -> Optional[int]:
+        """Find a user ID by email address."""
+        return await self._read(self.backend.find_user_by_email, email)
+
+    async def get_user_registrations(self, user_id: int) -> Optional[List[Event]]:
+        """Get the events a user is registered for, or None if the user doesn't exist."""
+        return await self._read(self.backend.get_user_registrations, user_id)
+
+    async def get_user_registrations_page(self, user_id: int, limit: int = 20,
+                                          cursor: Optional[str] = None) -> Optional[Page[Event]]:
+        """Get one page of a user's registrations; see EventRegistration.get_user_registrations_page."""
+        return await self._read(self.backend.get_user_registrations_page, user_id, limit, cursor)
+
+    async def get_event_registrants_page(self, event_id: int, limit: int = 20,
+                                         cursor: Optional[str] = None) -> Optional[Page[User]]:
+        """Get one page of an event's registrants; see EventRegistration.get_event_registrants_page."""
+        return await self._read(self.backend.get_event_registrants_page, event_id, limit, cursor)
+
+    # Reports
+
+    async def get_registration_report(self) -> Dict[int, int]:
+        """Get event_id -> registration count for every event."""
+        return await self._read(self.backend.get_registration_report)
+
+    async def get_detailed_report(self) -> List[Dict]:
+        """Get the cached detailed report; see EventRegistration.get_detailed_report."""
+        return await self._read(self.backend.get_detailed_report)
+
+    async def report_version(self) -> int:
+        """Get the current data version; see EventRegistration.report_version."""
+        return await self._read(self.backend.report_version)
+
+    async def aclose(self) -> None:
+        """Finish queued registrations and stop the worker threads."""
+        while self._drain_task is not None:
+            await self._drain_task
+        self._readers.shutdown(wait=False)
+        self._writer.shutdown(wait=True)
+
+    async def __aenter__(self) -> "AsyncEventRegistration":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
@@ -0,0 +1,274 @@
+"""
+Benchmarks for the EventRegistration backend.
+
+Run from this directory:
+
+    python benchmark_event_registration.py --scale 100k --output results.json
+    python benchmark_event_registration.py --users 5000 --storage sqlite
+
+Synthetic events and users are generated from a fixed seed, so runs at the same
+scale are comparable. Results (throughput, latency percentiles in microseconds,
+report timings and memory) are printed and, with --output, written as JSON so
+runs from different versions can be diffed.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from event_registration import EventRegistration
+from registration_models import User
+from registration_storage import SQLiteStorage
+
+SCALES = {"1k": 1_000, "100k": 100_000, "1M": 1_000_000}
+
+
+@dataclass
+class LegacyUser:
+    """The original User representation: a plain dataclass with a list of event IDs."""
+    id: int
+    name: str
+    email: str
+    phone: str
+    event_ids: List[int]
+
+
+def _traced_bytes(build) -> int:
+    """Return the bytes still allocated after calling build(), keeping its result alive."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return current
+
+
+def _user_rows(users: int, events_per_user: int) -> List[tuple]:
+    """Synthetic registration rows spread over the six sample events."""
+    return [(event_id, f"User {i}", f"user{i}@example.com", "1234567890")
+            for i in range(users) for event_id in range(1, events_per_user + 1)]
+
+
+def benchmark_memory(users: int, events_per_user: int = 1) -> dict:
+    """
+    Measure the memory cost of user records, before and after the compact representation.
+
+    Returns:
+        dict: Bytes per user for bare records (legacy vs current) and for a fully
+        indexed in-memory EventRegistration
+    """
+    names = [f"User {i}" for i in range(users)]
+    emails = [f"user{i}@example.com" for i in range(users)]
+    event_ids = list(range(1, events_per_user + 1))
+
+    legacy = _traced_bytes(lambda: [LegacyUser(i, names[i], emails[i], "1234567890", list(event_ids))
+                                    for i in range(users)])
+    compact = _traced_bytes(lambda: [User(i, names[i], emails[i], "1234567890", event_ids)
+                                     for i in range(users)])
+
+    rows = _user_rows(users, events_per_user)
+    del names, emails
+
+    def build_backend():
+        backend = EventRegistration()
+        backend.bulk_register(rows)
+        return backend
+
+    # The rows own the name/email strings, so the backend figure is the per-user
+    # overhead of records plus indexes.
+    system = _traced_bytes(build_backend)
+    return {
+        "users": users,
+        "events_per_user": events_per_user,
+        "legacy_record_bytes_per_user": legacy / users,
+        "record_bytes_per_user": compact / users,
+        "backend_bytes_per_user": system / users,
+    }
+
+
+def _percentiles(samples_ns: List[int]) -> Dict[str, float]:
+    """Summarize per-call timings as microsecond percentiles."""
+    cuts = statistics.quantiles(samples_ns, n=100, method="inclusive")
+    return {"p50_us": cuts[49] / 1000, "p90_us": cuts[89] / 1000, "p99_us": cuts[98] / 1000,
+            "max_us": max(samples_ns) / 1000}
+
+
+def _latency(call: Callable[[int], object], samples: int) -> Dict[str, float]:
+    """Time call(i) for i in range(samples), one measurement per call."""
+    clock = time.perf_counter_ns
+    timings = []
+    for i in range(samples):
+        start = clock()
+        call(i)
+        timings.append(clock() - start)
+    return _percentiles(timings)
+
+
+def _elapsed(call: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    call()
+    return time.perf_counter() - start
+
+
+def create_events(backend: EventRegistration, count: int, seed: int = 0) -> List[int]:
+    """Create synthetic events spread over a year; every fifth one has a capacity."""
+    rng = random.Random(seed)
+    topics = ["AI", "Leadership", "Innovation", "Startup", "Community", "Metaverse", "Design", "Data"]
+    venues = ["Tech Hub", "Business Center", "Innovation Lab", "Garage", "Community Hall", "VR Lab"]
+    first_day = datetime(2025, 1, 1, 9, 0)
+    event_ids = []
+    for i in range(count):
+        topic = rng.choice(topics)
+        start = first_day + timedelta(days=rng.randrange(365), hours=rng.randrange(10))
+        event = backend.create_event(
+            f"{topic} Workshop {i}", f"A synthetic {topic.lower()} event for benchmarking.",
+            start.strftime("%Y-%m-%d"), start.strftime("%H:%M"), rng.choice(venues),
+            capacity=rng.randrange(50, 500) if i % 5 == 0 else None)
+        event_ids.append(event.id)
+    return event_ids
+
+
+def benchmark_backend(backend: EventRegistration, users: int, events: int, samples: int = 2000,
+                      seed: int = 0) -> dict:
+    """
+    Load a backend with synthetic data and measure it.
+
+    Returns:
+        dict: Registration throughput (single and bulk), lookup latency percentiles,
+        and report generation times
+    """
+    rng = random.Random(seed)
+    event_ids = create_events(backend, events, seed)
+    half = users // 2
+    rows = [(rng.choice(event_ids), f"User {i}", f"user{i}@example.com", "1234567890") for i in range(users)]
+
+    def register_singly():
+        for row in rows[:half]:
+            backend.register_user_for_event(*row)
+
+    single_seconds = _elapsed(register_singly)
+    bulk_seconds = _elapsed(lambda: backend.bulk_register(rows[half:]))
+
+    probe = [rng.randrange(users) for _ in range(samples)]
+    probe_events = [rng.choice(event_ids) for _ in range(samples)]
+    user_ids = [backend.find_user_by_email(f"user{i}@example.com") for i in probe]
+    words = ["work", "ai", "innovation lab", "community", "data workshop"]
+    lookups = {
+        "find_user_by_email": _latency(lambda i: backend.find_user_by_email(f"user{probe[i]}@example.com"), samples),
+        "get_event_by_id": _latency(lambda i: backend.get_event_by_id(probe_events[i]), samples),
+        "get_user_registrations": _latency(lambda i: backend.get_user_registrations(user_ids[i]), samples),
+        "is_email_registered_for_event": _latency(
+            lambda i: backend.is_email_registered_for_event(f"user{probe[i]}@example.com", probe_events[i]), samples),
+        "get_events_page": _latency(lambda i: backend.get_events_page(20), samples),
+        "get_event_registrants_page": _latency(lambda i: backend.get_event_registrants_page(probe_events[i], 20),
+                                               samples),
+        "search_events": _latency(lambda i: backend.search_events(words[i % len(words)]), samples),
+    }
+
+    # A cold report follows a change; a warm one is served from the version cache.
+    backend.register_user_for_event(event_ids[0], "Report Probe", "report.probe@example.com", "1234567890")
+    reports = {
+        "registration_report_s": _elapsed(backend.get_registration_report),
+        "detailed_report_cold_s": _elapsed(backend.get_detailed_report),
+        "detailed_report_warm_s": _elapsed(backend.get_detailed_report),
+    }
+    return {
+        "registration": {
+            "single_per_s": half / single_seconds if half else 0.0,
+            "bulk_per_s": (users - half) / bulk_seconds if users - half else 0.0,
+        },
+        "lookup_latency": lookups,
+        "reports": reports,
+    }
+
+
+def run_suite(users: int, events: int = 100, storage: str = "memory", samples: int = 2000,
+              memory: bool = True, seed: int = 0) -> dict:
+    """
+    Run every benchmark at one scale.
+
+    Args:
+        users (int): Number of synthetic users (one registration each)
+        events (int): Number of synthetic events
+        storage (str): "memory" or "sqlite"
+        samples (int): Calls timed per lookup benchmark
+        memory (bool): Also run the (slower) memory benchmark; in-memory storage only
+        seed (int): Seed for the synthetic data
+
+    Returns:
+        dict: Machine-readable results, including the environment they were measured in
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        sqlite_storage = SQLiteStorage(os.path.join(tmpdir, "benchmark.db")) if storage == "sqlite" else None
+        try:
+            backend = EventRegistration(storage=sqlite_storage)
+            results = benchmark_backend(backend, users, events, samples, seed)
+        finally:
+            if sqlite_storage is not None:
+                sqlite_storage.close()
+
+    if memory and storage == "memory":
+        results["memory"] = benchmark_memory(users)
+    results["config"] = {"users": users, "events": events, "storage": storage, "samples": samples, "seed": seed}
+    results["environment"] = {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+    }
+    return results
+
+
+def _print_results(results: dict) -> None:
+    config = results["config"]
+    print(f"Users: {config['users']:,}  Events: {config['events']:,}  Storage: {config['storage']}")
+    registration = results["registration"]
+    print(f"Registration:  {registration['single_per_s']:12,.0f}/s single  {registration['bulk_per_s']:12,.0f}/s bulk")
+    for name, stats in results["lookup_latency"].items():
+        print(f"{name:30} p50 {stats['p50_us']:9.1f}us  p90 {stats['p90_us']:9.1f}us  p99 {stats['p99_us']:9.1f}us")
+    for name, seconds in results["reports"].items():
+        print(f"{name:30} {seconds * 1000:9.3f}ms")
+    memory = results.get("memory")
+    if memory:
+        print(f"Legacy User record:   {memory['legacy_record_bytes_per_user']:8.1f} bytes/user")
+        print(f"Compact User record:  {memory['record_bytes_per_user']:8.1f} bytes/user")
+        print(f"Indexed backend:      {memory['backend_bytes_per_user']:8.1f} bytes/user")
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    size = parser.add_mutually_exclusive_group()
+    size.add_argument("--scale", choices=SCALES, default="100k", help="Preset number of users")
+    size.add_argument("--users", type=int, help="Exact number of users (overrides --scale)")
+    parser.add_argument("--events", type=int, default=100)
+    parser.add_argument("--storage", choices=("memory", "sqlite"), default="memory")
+    parser.add_argument("--samples", type=int, default=2000, help="Calls timed per lookup benchmark")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the memory benchmark")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    users = args.users if args.users is not None else SCALES[args.scale]
+    results = run_suite(users, args.events, args.storage, args.samples, not args.no_memory, args.seed)
+    _print_results(results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
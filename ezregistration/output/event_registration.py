@@ -1,28 +1,64 @@
-from dataclasses import dataclass
-from typing import Optional, List, Tuple, Dict
-import re
-from datetime import datetime
+from dataclasses import asdict
+from typing import (Optional, List, Tuple, Dict, Any, Iterable, Iterator, Hashable, ContextManager, Mapping,
+                    Sequence, TextIO, Union)
+import threading
+from contextlib import ExitStack, nullcontext
+from datetime import datetime, timedelta
+
+from event_search import EventSearchIndex
+from registration_export import ExportRow, WRITERS
+from registration_journal import RegistrationJournal
+from registration_metrics import RegistrationMetrics, instrument
+from registration_models import Event, User
+from registration_pagination import Page, encode_cursor, decode_cursor
+from registration_storage import RegistrationStorage, MemoryStorage, normalize_email
+from registration_validation import ValidationCode, validate_registration, validate_registrations, parse_event_start
+
+
+class _LockStripes:
+    """
+    A fixed pool of locks that keys are hashed onto.
+
+    Operations on the same key always share a lock, while unrelated keys
+    usually land on different stripes and proceed in parallel. Memory stays
+    bounded no matter how many distinct keys are seen.
+    """
+
+    def __init__(self, stripes: int = 64):
+        self._locks = [threading.Lock() for _ in range(stripes)]
+
+    def hold(self, keys: Iterable[Hashable]) -> ExitStack:
+        """Acquire the stripes for all keys, in a fixed order to avoid deadlocks."""
+        stack = ExitStack()
+        for index in sorted({hash(key) % len(self._locks) for key in keys}):
+            stack.enter_context(self._locks[index])
+        return stack
 
 
-@dataclass
-class Event:
-    """A simple data class to represent an event."""
-    id: int
-    name: str
-    description: str
-    date: str  # format: YYYY-MM-DD
-    time: str  # format: HH:MM
-    location: str
+def _check_page_limit(limit: int) -> None:
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
 
 
-@dataclass
-class User:
-    """A simple data class to represent a user registration."""
-    id: int
-    name: str
-    email: str
-    phone: str
-    event_ids: List[int]  # List of event IDs the user is registered for
+def _decode_event_position(cursor: Optional[str], listing: str) -> Optional[Tuple[datetime, int]]:
+    """Decode an event listing cursor into the (start, event_id) it resumes after."""
+    if cursor is None:
+        return None
+    position = decode_cursor(cursor, listing)
+    try:
+        start, event_id = position
+        return datetime.fromisoformat(start), int(event_id)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid cursor") from None
+
+
+def _event_page(events: List[Event], limit: int, listing: str) -> Page[Event]:
+    """Build a page from up to limit + 1 events; the extra one only signals a next page."""
+    if len(events) <= limit:
+        return Page(events)
+    last = events[limit - 1]
+    position = [parse_event_start(last.date, last.time).isoformat(), last.id]
+    return Page(events[:limit], encode_cursor(listing, position))
 
 
 class EventRegistration:
@@ -32,15 +68,35 @@ class EventRegistration:
     account management, and reporting.
     """
 
-    def __init__(self):
+    def __init__(self, journal: Optional[RegistrationJournal] = None,
+                 storage: Optional[RegistrationStorage] = None, thread_safe: bool = False,
+                 metrics: Optional[RegistrationMetrics] = None):
         """
         Initialize the EventRegistration system with sample events and empty user database.
         Creates 6 sample events as specified in requirements.
+
+        Args:
+            journal (RegistrationJournal | None): Optional write-ahead journal. When given,
+                previously journaled state is restored and every mutation is recorded.
+            storage (RegistrationStorage | None): Storage backend, defaults to a new
+                MemoryStorage. Sample events are only added to an empty store.
+            thread_safe (bool): Allow concurrent calls from several threads. Mutations
+                lock the stripes of the email and events they touch, so unrelated
+                registrations run in parallel while duplicate-email checks stay atomic.
+            metrics (RegistrationMetrics | None): Record call counts and latencies of
+                the public methods (including calls they make to each other). Without
+                it, methods run uninstrumented.
         """
-        self.events: Dict[int, Event] = {}
-        self.users: Dict[int, User] = {}
-        self.next_event_id = 7  # starts after sample events
-        self.next_user_id = 1
+        self._storage = storage if storage is not None else MemoryStorage()
+        self.thread_safe = thread_safe
+        self._email_locks = _LockStripes() if thread_safe else None
+        self._event_locks = _LockStripes() if thread_safe else None
+        # Journal records must be appended and applied in the same order, and a
+        # snapshot must not interleave with a half-applied mutation.
+        self._commit_lock = threading.Lock() if thread_safe else nullcontext()
+        # (storage version, detailed report) from the last get_detailed_report call
+        self._report_cache: Optional[Tuple[int, List[Dict]]] = None
+        self._search_index = EventSearchIndex()
 
         # Create sample events
         sample_events = [
@@ -64,8 +120,99 @@ class EventRegistration:
              "2024-07-10", "15:00", "Virtual Reality Lab"),
         ]
 
-        for event_id, name, description, date, time, location in sample_events:
-            self.events[event_id] = Event(event_id, name, description, date, time, location)
+        with self._storage.transaction():
+            if not self._storage.events:
+                for event_id, name, description, date, time, location in sample_events:
+                    self._storage.add_event(Event(event_id, name, description, date, time, location))
+
+        self._journal = journal
+        if journal is not None:
+            self._restore_from_journal()
+
+        self.metrics = metrics
+        if metrics is not None:
+            instrument(self, metrics)
+
+    @property
+    def events(self) -> Dict[int, Event]:
+        """Mapping of event_id -> Event (read-only for non-memory storage)."""
+        return self._storage.events
+
+    @property
+    def users(self) -> Dict[int, User]:
+        """Mapping of user_id -> User (read-only for non-memory storage)."""
+        return self._storage.users
+
+    def _locked(self, emails: Iterable[str] = (), event_ids: Iterable[int] = ()) -> ContextManager:
+        """Hold the email and event lock stripes for a mutation (no-op unless thread_safe)."""
+        if not self.thread_safe:
+            return nullcontext()
+        stack = ExitStack()
+        # Always email stripes first, then event stripes.
+        stack.enter_context(self._email_locks.hold(normalize_email(email) for email in emails))
+        stack.enter_context(self._event_locks.hold(event_ids))
+        return stack
+
+    # Persistence
+
+    def _restore_from_journal(self) -> None:
+        """Load the journal snapshot and replay the log records written after it."""
+        snapshot, records = self._journal.load()
+        if snapshot is not None:
+            self._storage.load_state(snapshot)
+        with self._storage.transaction():
+            for record in records:
+                self._apply_record(record)
+
+    def _apply_record(self, record: Dict[str, Any]) -> None:
+        """Apply one journaled mutation to storage."""
+        op = record["op"]
+        if op == "create_event":
+            event = Event(**record["event"])
+            self._storage.add_event(event)
+            self._search_index.add(event)
+        elif op == "register":
+            user_id = record["user_id"]
+            if user_id not in self._storage.users:
+                self._storage.add_user(user_id, record["name"], record["email"], record["phone"])
+            if record.get("waitlist"):
+                self._storage.add_to_waitlist(record["event_id"], user_id)
+            else:
+                self._storage.add_registration(record["event_id"], user_id)
+        elif op == "batch":
+            # Several mutations journaled as one line, so they replay all or nothing.
+            for sub_record in record["records"]:
+                self._apply_record(sub_record)
+        elif op == "delete_user":
+            user_id = record["user_id"]
+            freed_event_ids = list(self._storage.users[user_id].event_ids)
+            self._storage.remove_user(user_id)
+            # Promotion is deterministic given the state, so replaying the
+            # delete record repeats it exactly.
+            for event_id in freed_event_ids:
+                self._promote_from_waitlist(event_id)
+        else:
+            raise ValueError(f"Unknown journal operation: {op}")
+
+    def _promote_from_waitlist(self, event_id: int) -> None:
+        """Move users from the head of an event's waitlist into its free seats."""
+        capacity = self.events[event_id].capacity
+        while capacity is None or self._storage.registration_count(event_id) < capacity:
+            user_id = self._storage.pop_waitlist(event_id)
+            if user_id is None:
+                return
+            self._storage.add_registration(event_id, user_id)
+
+    def _commit(self, record: Dict[str, Any]) -> None:
+        """Journal a mutation (if journaling is enabled), then apply it."""
+        if self._journal is None:
+            self._apply_record(record)
+            return
+        with self._commit_lock:
+            snapshot_due = self._journal.append(record)
+            self._apply_record(record)
+            if snapshot_due:
+                self._journal.write_snapshot(self._storage.dump_state())
 
     # 1. Event Management Methods
 
@@ -76,10 +223,25 @@ class EventRegistration:
         Returns:
             list[Event]: List of all Event objects, sorted by date
         """
-        events_list = list(self.events.values())
-        # Sort by date, then time
-        events_list.sort(key=lambda e: (e.date, e.time))
-        return events_list
+        return self._storage.list_events()
+
+    def get_events_page(self, limit: int = 20, cursor: Optional[str] = None) -> Page[Event]:
+        """
+        Retrieve one page of events, in the same order as get_all_events.
+
+        Args:
+            limit (int): Maximum number of events on the page
+            cursor (str | None): next_cursor of the previous page, or None for the first page
+
+        Returns:
+            Page[Event]: The events and the cursor of the following page
+
+        Raises:
+            ValueError: If limit is not positive or the cursor is invalid
+        """
+        _check_page_limit(limit)
+        after = _decode_event_position(cursor, "events")
+        return _event_page(self._storage.events_after(after, limit + 1), limit, "events")
 
     def get_event_by_id(self, event_id: int) -> Optional[Event]:
         """
@@ -93,7 +255,8 @@ class EventRegistration:
         """
         return self.events.get(event_id)
 
-    def create_event(self, name: str, description: str, date: str, time: str, location: str) -> Event:
+    def create_event(self, name: str, description: str, date: str, time: str, location: str,
+                     capacity: Optional[int] = None) -> Event:
         """
         Create a new event (for system extensibility).
 
@@ -103,30 +266,79 @@ class EventRegistration:
             date (str): Event date (YYYY-MM-DD)
             time (str): Event time (HH:MM)
             location (str): Event location
+            capacity (int | None): Maximum number of registrations, None for unlimited.
+                Registrations beyond it join a FIFO waitlist.
 
         Returns:
             Event: The newly created Event object
 
         Raises:
-            ValueError: If date or time format is invalid
-        """
-        # Validate date format
-        try:
-            datetime.strptime(date, "%Y-%m-%d")
-        except ValueError:
-            raise ValueError("Invalid date format. Use YYYY-MM-DD")
-
-        # Validate time format
-        try:
-            datetime.strptime(time, "%H:%M")
-        except ValueError:
-            raise ValueError("Invalid time format. Use HH:MM")
-
-        event_id = self.next_event_id
-        self.next_event_id += 1
-        event = Event(event_id, name, description, date, time, location)
-        self.events[event_id] = event
-        return event
+            ValueError: If date or time format or capacity is invalid
+        """
+        # Validate date and time format (the parsed start is cached for indexing)
+        parse_event_start(date, time)
+
+        if capacity is not None and capacity < 1:
+            raise ValueError("Capacity must be a positive number")
+
+        with self._storage.transaction():
+            event = Event(self._storage.allocate_id("event"), name, description, date, time, location, capacity)
+            self._commit({"op": "create_event", "event": asdict(event)})
+        return self.events[event.id]
+
+    def get_events_between(self, start: datetime, end: datetime) -> List[Event]:
+        """
+        Retrieve events starting within a time range.
+
+        Args:
+            start (datetime): Inclusive lower bound of the event start
+            end (datetime): Exclusive upper bound of the event start
+
+        Returns:
+            list[Event]: Events in the range, sorted by date
+        """
+        return self._storage.events_between(start, end)
+
+    def get_upcoming_events(self, days: int = 7, now: Optional[datetime] = None) -> List[Event]:
+        """
+        Retrieve events starting within the next number of days.
+
+        Args:
+            days (int): Size of the window in days
+            now (datetime | None): Start of the window, defaults to the current time
+
+        Returns:
+            list[Event]: Upcoming events, sorted by date
+        """
+        if now is None:
+            now = datetime.now()
+        return self.get_events_between(now, now + timedelta(days=days))
+
+    def search_events(self, query: str, limit: int = 10) -> List[Event]:
+        """
+        Search event names, locations and descriptions by keyword.
+
+        Every word of the query must match the start of a word in the event; matches
+        in the name rank above the location, which rank above the description.
+
+        Args:
+            query (str): Keywords, e.g. "innovation work"
+            limit (int): Maximum number of events to return
+
+        Returns:
+            list[Event]: Matching events, best match first
+        """
+        index = self._search_index
+        # Events are never deleted, so a count mismatch means some were added
+        # without create_event (sample events, snapshots, another process).
+        if len(index) != len(self.events):
+            index.add_many(self.events[event_id] for event_id in list(self.events) if event_id not in index)
+        results = []
+        for event_id, _ in index.search(query, limit):
+            event = self.events.get(event_id)
+            if event is not None:
+                results.append(event)
+        return results
 
     # 2. User Registration Methods
 
@@ -142,27 +354,24 @@ class EventRegistration:
         Returns:
             tuple[bool, str]: Validation result and error message if invalid
         """
-        # Check non-empty
-        if not name or not name.strip():
-            return False, "Name cannot be empty"
-        if not email or not email.strip():
-            return False, "Email cannot be empty"
-        if not phone or not phone.strip():
-            return False, "Phone cannot be empty"
-
-        # Email validation: simple check for @ and .
-        if "@" not in email or "." not in email:
-            return False, "Invalid email format"
-
-        # Phone validation: digits only, 10-15 characters
-        phone_digits = re.sub(r'\D', '', phone)
-        if len(phone_digits) < 10 or len(phone_digits) > 15:
-            return False, "Phone number must be 10-15 digits"
-        if not phone_digits.isdigit():
-            return False, "Phone number must contain only digits"
-
+        code = validate_registration(name, email, phone)
+        if code is not None:
+            return False, code.message
         return True, ""
 
+    def validate_registration_batch(self, records: Iterable[Tuple[str, str, str]]) -> List[Optional[ValidationCode]]:
+        """
+        Validate many sets of registration data at once.
+
+        Args:
+            records (Iterable[tuple[str, str, str]]): (name, email, phone) records
+
+        Returns:
+            list[ValidationCode | None]: One structured error code per record,
+            None for valid records
+        """
+        return validate_registrations(records)
+
     def is_email_registered_for_event(self, email: str, event_id: int) -> bool:
         """
         Check if an email is already registered for a specific event.
@@ -174,15 +383,19 @@ class EventRegistration:
         Returns:
             bool: True if email is registered for the event, False otherwise
         """
-        for user in self.users.values():
-            if user.email.lower() == email.lower() and event_id in user.event_ids:
-                return True
-        return False
+        user_id = self.find_user_by_email(email)
+        if user_id is None:
+            return False
+        user = self.users.get(user_id)
+        return user is not None and event_id in user.event_ids
 
     def register_user_for_event(self, event_id: int, name: str, email: str, phone: str) -> Tuple[bool, str, int]:
         """
         Register a user for an event with validation.
 
+        If the event is at capacity the user is added to its waitlist instead, and
+        is registered automatically once a seat frees up.
+
         Args:
             event_id (int): ID of the event to register for
             name (str): User's full name
@@ -204,25 +417,147 @@ class EventRegistration:
         if not is_valid:
             return False, error_msg, -1
 
-        # Check if email already registered for this event
-        if self.is_email_registered_for_event(email, event_id):
-            return False, f"Email {email} is already registered for this event", -1
+        with self._locked(emails=(email,), event_ids=(event_id,)), self._storage.transaction():
+            # Check if email already registered for this event
+            if self.is_email_registered_for_event(email, event_id):
+                return False, f"Email {email} is already registered for this event", -1
+
+            # Find existing user by email or create new user
+            user_id = self.find_user_by_email(email)
+            if user_id is None:
+                user_id = self._storage.allocate_id("user")
+            elif self._storage.is_waitlisted(event_id, user_id):
+                return False, f"Email {email} is already on the waitlist for this event", -1
+
+            capacity = self.events[event_id].capacity
+            full = capacity is not None and self._storage.registration_count(event_id) >= capacity
+            self._commit({"op": "register", "event_id": event_id, "user_id": user_id,
+                          "name": name.strip(), "email": email.strip(), "phone": phone.strip(),
+                          "waitlist": full})
+            if full:
+                position = self._storage.waitlist_length(event_id)
+                return True, f"Event is full, added to the waitlist at position {position}", user_id
+        return True, f"Successfully registered for event", user_id
+
+    def bulk_register(self, rows: Iterable[Union[Mapping[str, Any], Sequence[Any]]]) -> List[Tuple[bool, str, int]]:
+        """
+        Register many users at once, e.g. from a CSV export.
 
-        # Find existing user by email or create new user
-        user_id = self.find_user_by_email(email)
-        if user_id is not None:
-            # Existing user: add event to their registrations
-            user = self.users[user_id]
-            if event_id not in user.event_ids:
-                user.event_ids.append(event_id)
-            return True, f"Successfully registered for event", user_id
-        else:
-            # New user
-            user_id = self.next_user_id
-            self.next_user_id += 1
-            new_user = User(user_id, name.strip(), email.strip(), phone.strip(), [event_id])
-            self.users[user_id] = new_user
-            return True, f"Successfully registered for event", user_id
+        Rows are validated as a batch, emails are deduplicated within the batch,
+        and all valid rows are committed as a single unit (one journal record,
+        one storage transaction). Invalid rows are rejected individually and do
+        not prevent the others from being committed.
+
+        Args:
+            rows (Iterable[dict | tuple]): Rows with event_id, name, email and phone,
+                either as mappings (e.g. csv.DictReader rows) or in that order as sequences
+
+        Returns:
+            list[tuple[bool, str, int]]: One (success, message, user_id) result per row,
+            in input order, with the same meaning as register_user_for_event
+        """
+        results: List[Tuple[bool, str, int]] = []
+        pending = []  # (row index, event_id, name, email, phone)
+        seen: Dict[Tuple[str, int], int] = {}  # (email key, event_id) -> row index of its first occurrence
+        duplicates = []  # (row index, first row index, email)
+
+        parsed: List[Union[Tuple[Any, Any, Any, Any], str]] = []  # row fields, or why the row is malformed
+        for row in rows:
+            if isinstance(row, Mapping):
+                fields = (row.get("event_id"), row.get("name"), row.get("email"), row.get("phone"))
+            else:
+                try:
+                    event_id, name, email, phone = row
+                except (TypeError, ValueError):
+                    parsed.append("Invalid row: expected event_id, name, email and phone")
+                    continue
+                fields = (event_id, name, email, phone)
+            if any(field is not None and not isinstance(field, str) for field in fields[1:]):
+                parsed.append("Invalid row: name, email and phone must be text")
+                continue
+            parsed.append(fields)
+        codes = iter(validate_registrations(fields[1:] for fields in parsed if not isinstance(fields, str)))
+
+        for index, fields in enumerate(parsed):
+            if isinstance(fields, str):
+                results.append((False, fields, -1))
+                continue
+            event_id, name, email, phone = fields
+            code = next(codes)
+            try:
+                event_id = int(event_id)
+            except (TypeError, ValueError):
+                results.append((False, f"Invalid event ID {event_id!r}", -1))
+                continue
+            if event_id not in self.events:
+                results.append((False, f"Event with ID {event_id} does not exist", -1))
+                continue
+            if code is not None:
+                results.append((False, code.message, -1))
+                continue
+            key = (normalize_email(email), event_id)
+            if key in seen:
+                results.append(None)  # answered once the first occurrence is
+                duplicates.append((index, seen[key], email))
+                continue
+            seen[key] = index
+            results.append(None)  # filled in below
+            pending.append((index, event_id, name.strip(), email.strip(), phone.strip()))
+
+        if not pending:
+            return results
+
+        emails = {email for _, _, _, email, _ in pending}
+        event_ids = {event_id for _, event_id, _, _, _ in pending}
+        with self._locked(emails=emails, event_ids=event_ids), self._storage.transaction():
+            records = []
+            batch_users: Dict[str, int] = {}  # email key -> user_id for users new in this batch
+            seats: Dict[int, int] = {}  # event_id -> registrations including this batch
+            waiting: Dict[int, int] = {}  # event_id -> waitlist length including this batch
+            on_waitlist: Dict[int, bool] = {}  # row index -> whether the email ends up waitlisted
+            for index, event_id, name, email, phone in pending:
+                email_key = normalize_email(email)
+                user_id = batch_users.get(email_key)
+                if user_id is None:
+                    user_id = self.find_user_by_email(email)
+                    if user_id is not None:
+                        if event_id in self.users[user_id].event_ids:
+                            results[index] = (False, f"Email {email} is already registered for this event", -1)
+                            on_waitlist[index] = False
+                            continue
+                        if self._storage.is_waitlisted(event_id, user_id):
+                            results[index] = (False, f"Email {email} is already on the waitlist for this event", -1)
+                            on_waitlist[index] = True
+                            continue
+                    else:
+                        user_id = self._storage.allocate_id("user")
+                        batch_users[email_key] = user_id
+
+                if event_id not in seats:
+                    seats[event_id] = self._storage.registration_count(event_id)
+                    waiting[event_id] = self._storage.waitlist_length(event_id)
+                capacity = self.events[event_id].capacity
+                full = capacity is not None and seats[event_id] >= capacity
+                on_waitlist[index] = full
+                if full:
+                    waiting[event_id] += 1
+                    results[index] = (True, f"Event is full, added to the waitlist at position {waiting[event_id]}", user_id)
+                else:
+                    seats[event_id] += 1
+                    results[index] = (True, "Successfully registered for event", user_id)
+                records.append({"op": "register", "event_id": event_id, "user_id": user_id,
+                                "name": name, "email": email, "phone": phone, "waitlist": full})
+
+            if records:
+                self._commit({"op": "batch", "records": records})
+
+        # Repeats get the answer registering them one at a time after the first would.
+        for index, first, email in duplicates:
+            if on_waitlist[first]:
+                results[index] = (False, f"Email {email} is already on the waitlist for this event", -1)
+            else:
+                results[index] = (False, f"Email {email} is already registered for this event", -1)
+        return results
 
     # 3. User Account Management Methods
 
@@ -236,10 +571,7 @@ class EventRegistration:
         Returns:
             int | None: User ID if found, None otherwise
         """
-        for user_id, user in self.users.items():
-            if user.email.lower() == email.lower():
-                return user_id
-        return None
+        return self._storage.find_user_id(email)
 
     def get_user_registrations(self, user_id: int) -> Optional[List[Event]]:
         """
@@ -255,34 +587,87 @@ class EventRegistration:
         if user_id not in self.users:
             return None
 
-        user = self.users[user_id]
-        events = []
-        for event_id in user.event_ids:
-            event = self.events.get(event_id)
-            if event:
-                events.append(event)
-        # Sort by date
-        events.sort(key=lambda e: (e.date, e.time))
-        return events
+        return self._storage.user_events(user_id)
+
+    def get_user_registrations_page(self, user_id: int, limit: int = 20,
+                                    cursor: Optional[str] = None) -> Optional[Page[Event]]:
+        """
+        Get one page of the events a user is registered for, sorted by date.
+
+        Args:
+            user_id (int): ID of the user
+            limit (int): Maximum number of events on the page
+            cursor (str | None): next_cursor of the previous page, or None for the first page
+
+        Returns:
+            Page[Event] | None: The events and the cursor of the following page,
+                                or None if user doesn't exist
+
+        Raises:
+            ValueError: If limit is not positive or the cursor is invalid
+        """
+        _check_page_limit(limit)
+        listing = f"registrations:{user_id}"
+        after = _decode_event_position(cursor, listing)
+        if user_id not in self.users:
+            return None
+
+        return _event_page(self._storage.user_events_after(user_id, after, limit + 1), limit, listing)
 
     def delete_user_account(self, user_id: int) -> Tuple[bool, str]:
         """
         Delete a user account and all their registrations.
 
+        Seats freed in capacity-limited events go to the head of their waitlists.
+
         Args:
             user_id (int): ID of the user to delete
 
         Returns:
             tuple[bool, str]: Success status and message
         """
-        if user_id not in self.users:
-            return False, f"User with ID {user_id} does not exist"
-
-        del self.users[user_id]
-        return True, f"User account {user_id} deleted successfully"
+        while True:
+            user = self.users.get(user_id)
+            if user is None:
+                return False, f"User with ID {user_id} does not exist"
+
+            event_ids = set(user.event_ids).union(self._storage.waitlisted_event_ids(user_id))
+            with self._locked(emails=(user.email,), event_ids=event_ids), self._storage.transaction():
+                # The user may have been deleted, or joined more events, before
+                # we got the locks; retry with the current event set.
+                user = self.users.get(user_id)
+                if user is None:
+                    return False, f"User with ID {user_id} does not exist"
+                if not event_ids.issuperset(user.event_ids) or \
+                        not event_ids.issuperset(self._storage.waitlisted_event_ids(user_id)):
+                    continue
+
+                self._commit({"op": "delete_user", "user_id": user_id})
+            return True, f"User account {user_id} deleted successfully"
 
     # 4. Reporting Methods
 
+    def report_version(self) -> int:
+        """
+        Get a stamp that changes whenever events, users or registrations change.
+
+        Returns:
+            int: Current version of the stored data
+        """
+        return self._storage.version()
+
+    def has_changed_since(self, version: int) -> bool:
+        """
+        Check whether anything changed after a version returned by report_version.
+
+        Args:
+            version (int): Previously observed version
+
+        Returns:
+            bool: True if the data (and so any report) may differ from that version
+        """
+        return self._storage.version() != version
+
     def get_registration_report(self) -> Dict[int, int]:
         """
         Generate a report of registrations per event.
@@ -290,17 +675,16 @@ class EventRegistration:
         Returns:
             dict: Dictionary with event_id as keys and registration count as values
         """
-        report = {event_id: 0 for event_id in self.events.keys()}
-        for user in self.users.values():
-            for event_id in user.event_ids:
-                if event_id in report:
-                    report[event_id] += 1
-        return report
+        return self._storage.registration_counts()
 
     def get_detailed_report(self) -> List[Dict]:
         """
         Generate a detailed report for display.
 
+        Per-event counts are maintained on every registration and deletion, and the
+        report is cached until the data changes, so repeated calls are O(1). The
+        returned list is shared between callers and must not be modified.
+
         Returns:
             list[dict]: List of dictionaries with event details and registration count
             Each dict contains:
@@ -308,20 +692,81 @@ class EventRegistration:
                 - event_name (str)
                 - registrations (int)
         """
-        basic_report = self.get_registration_report()
+        # Read the version first: a change made while building stamps the new
+        # report as stale, never the reverse.
+        version = self._storage.version()
+        cached = self._report_cache
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
         detailed = []
-        for event_id, count in basic_report.items():
-            event = self.events.get(event_id)
-            if event:
-                detailed.append({
-                    "event_id": event_id,
-                    "event_name": event.name,
-                    "registrations": count
-                })
-        # Sort by event_id
-        detailed.sort(key=lambda x: x["event_id"])
+        for event_id, count in self._storage.registration_counts().items():
+            detailed.append({
+                "event_id": event_id,
+                "event_name": self.events[event_id].name,
+                "registrations": count
+            })
+        self._report_cache = (version, detailed)
         return detailed
 
+    def iter_registrations(self, event_id: Optional[int] = None,
+                           batch_size: int = 1000) -> Iterator[List[ExportRow]]:
+        """
+        Stream registrations in batches without building the full registrant list.
+
+        Args:
+            event_id (int | None): Event to export, or None for every event in ID order
+            batch_size (int): Maximum number of rows per batch
+
+        Returns:
+            Iterator[list[tuple]]: Batches of (event_id, event_name, user_id, name,
+            email, phone) rows, ordered by user ID within each event
+
+        Raises:
+            ValueError: If the event doesn't exist or batch_size is not positive
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if event_id is None:
+            event_ids = sorted(self.events)
+        elif event_id in self.events:
+            event_ids = [event_id]
+        else:
+            raise ValueError(f"Event {event_id} not found")
+        # Arguments are checked eagerly; the batches are produced lazily.
+        return self._registration_batches(event_ids, batch_size)
+
+    def _registration_batches(self, event_ids: List[int], batch_size: int) -> Iterator[List[ExportRow]]:
+        for event_id in event_ids:
+            event = self.events.get(event_id)
+            if event is None:
+                continue
+            for batch in self._storage.registrant_batches(event_id, batch_size):
+                yield [(event_id, event.name) + row for row in batch]
+
+    def export_registrations(self, file: TextIO, fmt: str = "csv", event_id: Optional[int] = None,
+                             batch_size: int = 1000, flush: bool = True) -> int:
+        """
+        Export registrations to a text file as CSV or JSON Lines in bounded memory.
+
+        Args:
+            file (TextIO): Writable text file (open CSV files with newline="")
+            fmt (str): "csv" or "jsonl"
+            event_id (int | None): Event to export, or None for every event
+            batch_size (int): Rows read and written per chunk
+            flush (bool): Flush the file after every chunk
+
+        Returns:
+            int: Number of registrations written
+
+        Raises:
+            ValueError: If the format is unknown or the event doesn't exist
+        """
+        writer = WRITERS.get(fmt)
+        if writer is None:
+            raise ValueError(f"Unknown export format {fmt!r}, expected one of {', '.join(WRITERS)}")
+        return writer(self.iter_registrations(event_id, batch_size), file, flush)
+
     # 5. Utility Methods
 
     def get_event_registrants(self, event_id: int) -> Optional[List[User]]:
@@ -338,8 +783,69 @@ class EventRegistration:
         if event_id not in self.events:
             return None
 
-        registrants = []
-        for user in self.users.values():
-            if event_id in user.event_ids:
-                registrants.append(user)
-        return registrants
\ No newline at end of file
+        return self._storage.registrants(event_id)
+
+    def get_event_registrants_page(self, event_id: int, limit: int = 20,
+                                   cursor: Optional[str] = None) -> Optional[Page[User]]:
+        """
+        Get one page of the users registered for an event, ordered by user ID.
+
+        Args:
+            event_id (int): ID of the event
+            limit (int): Maximum number of users on the page
+            cursor (str | None): next_cursor of the previous page, or None for the first page
+
+        Returns:
+            Page[User] | None: The users and the cursor of the following page,
+                               or None if event doesn't exist
+
+        Raises:
+            ValueError: If limit is not positive or the cursor is invalid
+        """
+        _check_page_limit(limit)
+        listing = f"registrants:{event_id}"
+        after_user_id = 0
+        if cursor is not None:
+            position = decode_cursor(cursor, listing)
+            if len(position) != 1 or not isinstance(position[0], int):
+                raise ValueError("Invalid cursor")
+            after_user_id = position[0]
+        if event_id not in self.events:
+            return None
+
+        users = self._storage.registrants_after(event_id, after_user_id, limit + 1)
+        if len(users) <= limit:
+            return Page(users)
+        return Page(users[:limit], encode_cursor(listing, [users[limit - 1].id]))
+
+    def get_event_waitlist(self, event_id: int) -> Optional[List[User]]:
+        """
+        Get the users waiting for a seat at a specific event.
+
+        Args:
+            event_id (int): ID of the event
+
+        Returns:
+            list[User] | None: Waiting users, first in line first,
+                              or None if event doesn't exist
+        """
+        if event_id not in self.events:
+            return None
+
+        users = self.users
+        # Skip users deleted since the waitlist was read.
+        return [user for user in map(users.get, self._storage.waitlist(event_id)) if user is not None]
+
+    def get_event_registration_count(self, event_id: int) -> Optional[int]:
+        """
+        Get the number of users registered for a specific event.
+
+        Args:
+            event_id (int): ID of the event
+
+        Returns:
+            int | None: Registration count, or None if event doesn't exist
+        """
+        if event_id not in self.events:
+            return None
+        return self._storage.registration_count(event_id)
\ No newline at end of file
@@ -0,0 +1,114 @@
+import heapq
+import re
+import threading
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Set, Tuple
+
+from registration_models import Event
+
+_TOKEN = re.compile(r"\w+")
+
+# Relative weight of a term by the field it appears in.
+FIELD_WEIGHTS = (("name", 3.0), ("location", 2.0), ("description", 1.0))
+# Fraction of a term's weight earned when the query word is only a prefix of it.
+PREFIX_FACTOR = 0.5
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into case-folded word tokens."""
+    return _TOKEN.findall(text.casefold())
+
+
+class EventSearchIndex:
+    """
+    Inverted index over event names, descriptions and locations.
+
+    Each term maps to the events containing it and a field-weighted score, and
+    the vocabulary is kept sorted so a query word matches every term it
+    prefixes with one bisect. Query cost depends on the number of matching
+    terms and postings, not on the number of events indexed.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[int, float]] = {}  # term -> event_id -> weight
+        self._terms: List[str] = []  # sorted vocabulary
+        self._event_ids: Set[int] = set()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._event_ids)
+
+    def __contains__(self, event_id: object) -> bool:
+        return event_id in self._event_ids
+
+    def add(self, event: Event) -> None:
+        """Index an event; adding an already indexed event does nothing."""
+        weights: Dict[str, float] = {}
+        for field, weight in FIELD_WEIGHTS:
+            for term in tokenize(getattr(event, field)):
+                weights[term] = weights.get(term, 0.0) + weight
+        with self._lock:
+            if event.id in self._event_ids:
+                return
+            self._event_ids.add(event.id)
+            for term, weight in weights.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = {}
+                    insort(self._terms, term)
+                postings[event.id] = weight
+
+    def add_many(self, events: Iterable[Event]) -> None:
+        """Index several events."""
+        for event in events:
+            self.add(event)
+
+    def clear(self) -> None:
+        """Remove every event from the index."""
+        with self._lock:
+            self._postings.clear()
+            self._terms.clear()
+            self._event_ids.clear()
+
+    def _word_scores(self, word: str) -> Dict[int, float]:
+        """Score events for one query word: exact term matches plus discounted prefix matches."""
+        scores: Dict[int, float] = {}
+        terms = self._terms
+        i = bisect_left(terms, word)
+        while i < len(terms) and terms[i].startswith(word):
+            term = terms[i]
+            factor = 1.0 if term == word else PREFIX_FACTOR
+            for event_id, weight in self._postings[term].items():
+                score = weight * factor
+                if score > scores.get(event_id, 0.0):
+                    scores[event_id] = score
+            i += 1
+        return scores
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[int, float]]:
+        """
+        Find events matching every word of a query.
+
+        Args:
+            query (str): Free-text query; each word may be a prefix, e.g. "work" finds "workshop"
+            limit (int): Maximum number of results
+
+        Returns:
+            list[tuple[int, float]]: (event_id, score) pairs, best match first
+            (ties broken by event ID)
+        """
+        words = set(tokenize(query))
+        if not words or limit < 1:
+            return []
+        with self._lock:
+            totals = None
+            for word in words:
+                scores = self._word_scores(word)
+                if totals is None:
+                    totals = scores
+                else:
+                    totals = {event_id: total + scores[event_id]
+                              for event_id, total in totals.items() if event_id in scores}
+                if not totals:
+                    return []
+        return heapq.nsmallest(limit, totals.items(), key=lambda item: (-item[1], item[0]))
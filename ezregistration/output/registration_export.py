@@ -0,0 +1,55 @@
+import csv
+import json
+from typing import Iterable, List, Tuple, TextIO
+
+EXPORT_FIELDS = ("event_id", "event_name", "user_id", "name", "email", "phone")
+
+ExportRow = Tuple[int, str, int, str, str, str]
+
+
+def write_csv(batches: Iterable[List[ExportRow]], file: TextIO, flush: bool = True) -> int:
+    """
+    Write registration rows to a file as CSV with a header line.
+
+    Args:
+        batches (Iterable[list[tuple]]): Batches of rows in EXPORT_FIELDS order
+        file (TextIO): Text file opened with newline="" (or an io.StringIO)
+        flush (bool): Flush the file after every batch, so buffered output stays bounded
+
+    Returns:
+        int: Number of rows written, excluding the header
+    """
+    writer = csv.writer(file)
+    writer.writerow(EXPORT_FIELDS)
+    written = 0
+    for batch in batches:
+        writer.writerows(batch)
+        written += len(batch)
+        if flush:
+            file.flush()
+    return written
+
+
+def write_jsonl(batches: Iterable[List[ExportRow]], file: TextIO, flush: bool = True) -> int:
+    """
+    Write registration rows to a file as JSON Lines, one object per registration.
+
+    Args:
+        batches (Iterable[list[tuple]]): Batches of rows in EXPORT_FIELDS order
+        file (TextIO): Text file to write to
+        flush (bool): Flush the file after every batch, so buffered output stays bounded
+
+    Returns:
+        int: Number of rows written
+    """
+    dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    written = 0
+    for batch in batches:
+        file.write("".join(dumps(dict(zip(EXPORT_FIELDS, row))) + "\n" for row in batch))
+        written += len(batch)
+        if flush:
+            file.flush()
+    return written
+
+
+WRITERS = {"csv": write_csv, "jsonl": write_jsonl}
@@ -0,0 +1,173 @@
+import functools
+import logging
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Sequence
+
+# Histogram bucket upper bounds in seconds; a final +Inf bucket is implied.
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+slow_call_logger = logging.getLogger("event_registration.slow_calls")
+
+
+class _MethodStats:
+    """Counters and a latency histogram for one method."""
+    __slots__ = ("calls", "errors", "total_seconds", "max_seconds", "buckets")
+
+    def __init__(self, bucket_count: int):
+        self.calls = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.buckets = [0] * (bucket_count + 1)  # per bucket, not cumulative; last is +Inf
+
+
+class RegistrationMetrics:
+    """
+    Per-method call counters, latency histograms and a slow-call log.
+
+    Attach to a backend with ``EventRegistration(metrics=RegistrationMetrics())``.
+    Only instrumented instances pay for timing; without metrics the backend's
+    methods are called directly.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, slow_threshold: float = 0.1,
+                 slow_log_size: int = 100):
+        """
+        Create an empty metrics registry.
+
+        Args:
+            buckets (Sequence[float]): Sorted histogram bucket upper bounds in seconds
+            slow_threshold (float): Calls taking at least this many seconds are logged
+                as slow (to the "event_registration.slow_calls" logger)
+            slow_log_size (int): Number of recent slow calls kept for snapshot()
+        """
+        if list(buckets) != sorted(buckets):
+            raise ValueError("buckets must be sorted")
+        self.buckets = tuple(buckets)
+        self.slow_threshold = slow_threshold
+        self._stats: Dict[str, _MethodStats] = {}
+        self._slow_calls: Deque[Dict[str, Any]] = deque(maxlen=slow_log_size)
+        self._lock = threading.Lock()
+
+    def record(self, method: str, seconds: float, error: bool = False) -> None:
+        """
+        Record one call.
+
+        Args:
+            method (str): Method name
+            seconds (float): Call duration
+            error (bool): Whether the call raised
+        """
+        bucket = bisect_left(self.buckets, seconds)
+        with self._lock:
+            stats = self._stats.get(method)
+            if stats is None:
+                stats = self._stats[method] = _MethodStats(len(self.buckets))
+            stats.calls += 1
+            stats.errors += error
+            stats.total_seconds += seconds
+            if seconds > stats.max_seconds:
+                stats.max_seconds = seconds
+            stats.buckets[bucket] += 1
+            slow = seconds >= self.slow_threshold
+            if slow:
+                self._slow_calls.append({"method": method, "seconds": seconds, "at": time.time()})
+        if slow:
+            slow_call_logger.warning("Slow call: %s took %.3fs", method, seconds)
+
+    def wrap(self, method: str, func: Callable) -> Callable:
+        """Return func timed under the given method name."""
+        record = self.record
+        clock = time.perf_counter
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                result = func(*args, **kwargs)
+            except BaseException:
+                record(method, clock() - start, error=True)
+                raise
+            record(method, clock() - start)
+            return result
+
+        return timed
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a copy of the current metrics.
+
+        Returns:
+            dict: {"methods": {name: {calls, errors, total_seconds, mean_seconds,
+            max_seconds, buckets: [[upper bound, cumulative count], ...]}},
+            "slow_calls": [{method, seconds, at}, ...]}
+        """
+        with self._lock:
+            methods = {}
+            for name, stats in sorted(self._stats.items()):
+                cumulative, buckets = 0, []
+                for bound, count in zip(self.buckets + (float("inf"),), stats.buckets):
+                    cumulative += count
+                    buckets.append([bound, cumulative])
+                methods[name] = {
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "total_seconds": stats.total_seconds,
+                    "mean_seconds": stats.total_seconds / stats.calls,
+                    "max_seconds": stats.max_seconds,
+                    "buckets": buckets,
+                }
+            return {"methods": methods, "slow_calls": list(self._slow_calls)}
+
+    def to_prometheus(self, prefix: str = "ezregistration") -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        methods = self.snapshot()["methods"]
+        lines: List[str] = [
+            f"# HELP {prefix}_calls_total Calls per EventRegistration method.",
+            f"# TYPE {prefix}_calls_total counter",
+        ]
+        lines += [f'{prefix}_calls_total{{method="{name}"}} {m["calls"]}' for name, m in methods.items()]
+        lines += [
+            f"# HELP {prefix}_errors_total Calls per EventRegistration method that raised.",
+            f"# TYPE {prefix}_errors_total counter",
+        ]
+        lines += [f'{prefix}_errors_total{{method="{name}"}} {m["errors"]}' for name, m in methods.items()]
+        lines += [
+            f"# HELP {prefix}_call_duration_seconds EventRegistration method latency.",
+            f"# TYPE {prefix}_call_duration_seconds histogram",
+        ]
+        for name, m in methods.items():
+            for bound, count in m["buckets"]:
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{prefix}_call_duration_seconds_bucket{{method="{name}",le="{le}"}} {count}')
+            lines.append(f'{prefix}_call_duration_seconds_sum{{method="{name}"}} {m["total_seconds"]!r}')
+            lines.append(f'{prefix}_call_duration_seconds_count{{method="{name}"}} {m["calls"]}')
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Forget every recorded call."""
+        with self._lock:
+            self._stats.clear()
+            self._slow_calls.clear()
+
+
+def instrument(obj: Any, metrics: RegistrationMetrics, methods: Optional[Iterable[str]] = None) -> None:
+    """
+    Time an object's public methods by shadowing them with timed instance attributes.
+
+    Only this object is affected; other instances of its class keep calling the
+    plain methods.
+
+    Args:
+        obj (object): Object to instrument
+        metrics (RegistrationMetrics): Where calls are recorded
+        methods (Iterable[str] | None): Method names, defaults to every public method of obj's class
+    """
+    if methods is None:
+        methods = [name for name, attr in vars(type(obj)).items()
+                   if not name.startswith("_") and callable(attr)]
+    for name in methods:
+        setattr(obj, name, metrics.wrap(name, getattr(obj, name)))
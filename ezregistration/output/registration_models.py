@@ -0,0 +1,58 @@
+import sys
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+
+class EventIds(tuple):
+    """
+    Read-only sequence of a user's event IDs.
+
+    A tuple is a single exactly-sized allocation, and dataclasses.asdict and json
+    treat it like the list it replaces. It also compares equal to a list with the
+    same IDs, so callers comparing event_ids against a list keep working.
+    """
+    __slots__ = ()
+
+    def __eq__(self, other):
+        if isinstance(other, list):
+            other = tuple(other)
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = tuple.__hash__
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+@dataclass(slots=True)
+class Event:
+    """A simple data class to represent an event."""
+    id: int
+    name: str
+    description: str
+    date: str  # format: YYYY-MM-DD
+    time: str  # format: HH:MM
+    location: str
+    capacity: Optional[int] = None  # maximum registrations, None for unlimited
+
+    def __post_init__(self):
+        # Every copy of an event (e.g. rows re-read from SQLite) shares one name string.
+        self.name = sys.intern(self.name)
+
+
+@dataclass(slots=True)
+class User:
+    """A simple data class to represent a user registration."""
+    id: int
+    name: str
+    email: str
+    phone: str
+    event_ids: Iterable[int]  # IDs of the events the user is registered for, stored as EventIds
+
+    def __post_init__(self):
+        if not isinstance(self.event_ids, EventIds):
+            self.event_ids = EventIds(self.event_ids)
@@ -0,0 +1,43 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Any, Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class Page(Generic[T]):
+    """One page of a listing plus the cursor for the next page (None on the last page)."""
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(listing: str, position: List[Any]) -> str:
+    """
+    Encode a listing position as an opaque, URL-safe cursor string.
+
+    Args:
+        listing (str): Name of the listing the cursor belongs to, e.g. "events"
+        position (list): JSON-serializable sort key of the last item returned
+    """
+    data = json.dumps([listing, position], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, listing: str) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor for the same listing.
+
+    Raises:
+        ValueError: If the cursor is malformed or belongs to another listing
+    """
+    try:
+        data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cursor_listing, position = json.loads(data)
+    except (binascii.Error, ValueError, TypeError):
+        raise ValueError("Invalid cursor") from None
+    if cursor_listing != listing or not isinstance(position, list):
+        raise ValueError("Invalid cursor")
+    return position
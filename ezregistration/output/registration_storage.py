@@ -0,0 +1,781 @@
+import itertools
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict
+from datetime import datetime
+from typing import Optional, List, Tuple, Dict, Set, Any, Iterator, Mapping, Sequence, ContextManager
+
+from registration_models import Event, EventIds, User
+from registration_validation import parse_event_start
+
+ID_KINDS = ("event", "user")
+
+
+def normalize_email(email: str) -> str:
+    """Normalize an email address for case-insensitive lookups."""
+    return email.strip().casefold()
+
+
+def event_start(event: Event) -> datetime:
+    """Parse the start of an event from its date and time fields."""
+    return parse_event_start(event.date, event.time)
+
+
+class RegistrationStorage(ABC):
+    """
+    Storage interface behind EventRegistration.
+
+    Implementations hold events, users and registrations and answer the indexed
+    queries EventRegistration needs. They do not validate input: callers check
+    business rules (and allocate IDs) inside ``transaction()``, then mutate.
+    """
+
+    @property
+    @abstractmethod
+    def events(self) -> Mapping[int, Event]:
+        """Read-only mapping of event_id -> Event."""
+
+    @property
+    @abstractmethod
+    def users(self) -> Mapping[int, User]:
+        """Read-only mapping of user_id -> User."""
+
+    @abstractmethod
+    def transaction(self) -> ContextManager:
+        """Group checks and mutations so that they are applied atomically."""
+
+    @abstractmethod
+    def version(self) -> int:
+        """Return a stamp that changes whenever stored events, users or registrations change."""
+
+    @abstractmethod
+    def next_id(self, kind: str) -> int:
+        """Return the next unused ID of the given kind ("event" or "user")."""
+
+    @abstractmethod
+    def allocate_id(self, kind: str) -> int:
+        """Reserve and return the next unused ID of the given kind."""
+
+    @abstractmethod
+    def advance_id(self, kind: str, next_id: int) -> None:
+        """Ensure IDs of the given kind are allocated from at least ``next_id``."""
+
+    @abstractmethod
+    def add_event(self, event: Event) -> None:
+        """Store a new event."""
+
+    @abstractmethod
+    def add_user(self, user_id: int, name: str, email: str, phone: str) -> None:
+        """Store a new user with no registrations."""
+
+    @abstractmethod
+    def add_registration(self, event_id: int, user_id: int) -> None:
+        """Register an existing user for an existing event."""
+
+    @abstractmethod
+    def remove_user(self, user_id: int) -> None:
+        """Delete a user, their registrations and their waitlist entries."""
+
+    @abstractmethod
+    def add_to_waitlist(self, event_id: int, user_id: int) -> None:
+        """Append an existing user to the end of an event's waitlist."""
+
+    @abstractmethod
+    def pop_waitlist(self, event_id: int) -> Optional[int]:
+        """Remove and return the user at the head of an event's waitlist, if any."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Delete all events, users and registrations."""
+
+    @abstractmethod
+    def find_user_id(self, email: str) -> Optional[int]:
+        """Return the ID of the user with the given email (case-insensitive), if any."""
+
+    @abstractmethod
+    def list_events(self) -> List[Event]:
+        """Return all events ordered by start time."""
+
+    @abstractmethod
+    def events_between(self, start: datetime, end: datetime) -> List[Event]:
+        """Return events starting in [start, end) ordered by start time."""
+
+    @abstractmethod
+    def events_after(self, after: Optional[Tuple[datetime, int]], limit: int) -> List[Event]:
+        """Return up to ``limit`` events ordered by (start, ID) that come after the
+        ``after`` (start, ID) position, or from the beginning if it is None."""
+
+    @abstractmethod
+    def user_events(self, user_id: int) -> List[Event]:
+        """Return the events a user is registered for ordered by start time."""
+
+    @abstractmethod
+    def user_events_after(self, user_id: int, after: Optional[Tuple[datetime, int]],
+                          limit: int) -> List[Event]:
+        """Like events_after, restricted to the events a user is registered for."""
+
+    @abstractmethod
+    def registrants(self, event_id: int) -> List[User]:
+        """Return the users registered for an event ordered by user ID."""
+
+    @abstractmethod
+    def registrants_after(self, event_id: int, after_user_id: int, limit: int) -> List[User]:
+        """Return up to ``limit`` registrants of an event with IDs above ``after_user_id``."""
+
+    @abstractmethod
+    def registrant_batches(self, event_id: int, batch_size: int) -> Iterator[List[Tuple[int, str, str, str]]]:
+        """Yield (user_id, name, email, phone) rows for an event's registrants in
+        user ID order, at most ``batch_size`` rows at a time."""
+
+    @abstractmethod
+    def registration_count(self, event_id: int) -> int:
+        """Return the number of users registered for an event."""
+
+    @abstractmethod
+    def registration_counts(self) -> Dict[int, int]:
+        """Return event_id -> registration count for every event, ordered by event ID."""
+
+    @abstractmethod
+    def waitlist(self, event_id: int) -> List[int]:
+        """Return the user IDs waiting for an event, first in line first."""
+
+    @abstractmethod
+    def waitlist_length(self, event_id: int) -> int:
+        """Return the number of users waiting for an event."""
+
+    @abstractmethod
+    def is_waitlisted(self, event_id: int, user_id: int) -> bool:
+        """Return whether a user is on an event's waitlist."""
+
+    @abstractmethod
+    def waitlisted_event_ids(self, user_id: int) -> List[int]:
+        """Return the IDs of the events a user is waiting for."""
+
+    def close(self) -> None:
+        """Release any resources held by the storage."""
+
+    def dump_state(self) -> Dict[str, Any]:
+        """Return the full stored state as a JSON-serializable dict."""
+        return {
+            "next_ids": {kind: self.next_id(kind) for kind in ID_KINDS},
+            "events": [asdict(event) for event in self.events.values()],
+            "users": [{"id": user.id, "name": user.name, "email": user.email, "phone": user.phone,
+                       "event_ids": list(user.event_ids)} for user in self.users.values()],
+            "waitlists": [[event_id, self.waitlist(event_id)] for event_id in self.events
+                          if self.waitlist_length(event_id)],
+        }
+
+    def load_state(self, state: Dict[str, Any]) -> None:
+        """Replace the stored state with one produced by dump_state."""
+        with self.transaction():
+            self.clear()
+            for fields in state["events"]:
+                self.add_event(Event(**fields))
+            for fields in state["users"]:
+                self.add_user(fields["id"], fields["name"], fields["email"], fields["phone"])
+                for event_id in fields["event_ids"]:
+                    self.add_registration(event_id, fields["id"])
+            for event_id, user_ids in state.get("waitlists", ()):
+                for user_id in user_ids:
+                    self.add_to_waitlist(event_id, user_id)
+            for kind, next_id in state["next_ids"].items():
+                self.advance_id(kind, next_id)
+
+
+class MemoryStorage(RegistrationStorage):
+    """In-process storage using dicts plus secondary indexes."""
+
+    def __init__(self):
+        self._events: Dict[int, Event] = {}
+        self._users: Dict[int, User] = {}
+        self._email_index: Dict[str, int] = {}  # case-folded email -> user_id
+        # event_id -> sorted user_ids; an array is far smaller than a set and
+        # gives ordered, bisectable pages
+        self._event_registrants: Dict[int, array] = {}
+        self._timeline: List[Tuple[datetime, int]] = []  # (start, event_id), kept sorted
+        self._timeline_lock = threading.Lock()  # serializes copy-on-write timeline updates
+        # Serializes read-modify-write of a user's event_ids: waitlist promotion runs
+        # under the deleted user's locks, not the promoted user's.
+        self._registration_lock = threading.Lock()
+        # event_id -> user_ids in arrival order; a dict gives O(1) FIFO pops and removals
+        self._waitlists: Dict[int, Dict[int, None]] = {}
+        self._user_waitlists: Dict[int, Set[int]] = {}  # user_id -> waitlisted event_ids
+        self._next_ids: Dict[str, int] = {kind: 1 for kind in ID_KINDS}
+        self._id_lock = threading.Lock()
+        # next() on a count is atomic, so concurrent mutators never share a stamp.
+        self._versions = itertools.count(1)
+        self._version = 0
+
+    @property
+    def events(self) -> Dict[int, Event]:
+        return self._events
+
+    @property
+    def users(self) -> Dict[int, User]:
+        return self._users
+
+    def transaction(self) -> ContextManager:
+        return nullcontext()
+
+    def version(self) -> int:
+        return self._version
+
+    def _changed(self) -> None:
+        self._version = next(self._versions)
+
+    def next_id(self, kind: str) -> int:
+        return self._next_ids[kind]
+
+    def allocate_id(self, kind: str) -> int:
+        with self._id_lock:
+            next_id = self._next_ids[kind]
+            self._next_ids[kind] = next_id + 1
+        return next_id
+
+    def advance_id(self, kind: str, next_id: int) -> None:
+        with self._id_lock:
+            if next_id > self._next_ids[kind]:
+                self._next_ids[kind] = next_id
+
+    def add_event(self, event: Event) -> None:
+        self._event_registrants[event.id] = array("i")
+        self._waitlists[event.id] = {}
+        self._events[event.id] = event
+        # Copy-on-write, so concurrent readers iterate a consistent timeline; the
+        # lock keeps concurrent writers from replacing each other's copy.
+        with self._timeline_lock:
+            timeline = self._timeline.copy()
+            insort(timeline, (event_start(event), event.id))
+            self._timeline = timeline
+        self.advance_id("event", event.id + 1)
+        self._changed()
+
+    def add_user(self, user_id: int, name: str, email: str, phone: str) -> None:
+        self._users[user_id] = User(user_id, name, email, phone, [])
+        key = normalize_email(email)
+        # Share the user's email string as the key when it is already normalized.
+        self._email_index[email if key == email else key] = user_id
+        self.advance_id("user", user_id + 1)
+        self._changed()
+
+    def add_registration(self, event_id: int, user_id: int) -> None:
+        user = self._users[user_id]
+        with self._registration_lock:
+            if event_id in user.event_ids:
+                return
+            # Keep the user's events in timeline order, so their listing needs no sort.
+            # A new tuple replaces the old one, so readers iterating it are unaffected.
+            # Reusing the Event's own int object keeps large IDs from being duplicated per user.
+            event_ids = user.event_ids
+            i = bisect_right(event_ids, self._timeline_key(event_id), key=self._timeline_key)
+            user.event_ids = EventIds((*event_ids[:i], self._events[event_id].id, *event_ids[i:]))
+            # IDs are allocated in increasing order, so this is nearly always an append.
+            insort(self._event_registrants[event_id], user_id)
+        self._changed()
+
+    def remove_user(self, user_id: int) -> None:
+        # Drop the user from every index before _users, so lock-free readers that
+        # still see the ID find the user (readers also skip IDs that vanish).
+        user = self._users[user_id]
+        for event_id in user.event_ids:
+            registrants = self._event_registrants.get(event_id)
+            if registrants is not None:
+                i = bisect_left(registrants, user_id)
+                if i < len(registrants) and registrants[i] == user_id:
+                    del registrants[i]
+        for event_id in self._user_waitlists.pop(user_id, ()):
+            self._waitlists[event_id].pop(user_id, None)
+        self._email_index.pop(normalize_email(user.email), None)
+        del self._users[user_id]
+        self._changed()
+
+    def add_to_waitlist(self, event_id: int, user_id: int) -> None:
+        self._waitlists[event_id][user_id] = None
+        self._user_waitlists.setdefault(user_id, set()).add(event_id)
+        self._changed()
+
+    def pop_waitlist(self, event_id: int) -> Optional[int]:
+        waitlist = self._waitlists[event_id]
+        if not waitlist:
+            return None
+        user_id = next(iter(waitlist))
+        del waitlist[user_id]
+        self._user_waitlists[user_id].discard(event_id)
+        self._changed()
+        return user_id
+
+    def clear(self) -> None:
+        self._events.clear()
+        self._users.clear()
+        self._email_index.clear()
+        self._event_registrants.clear()
+        self._waitlists.clear()
+        self._user_waitlists.clear()
+        self._timeline = []
+        self._changed()
+
+    def find_user_id(self, email: str) -> Optional[int]:
+        return self._email_index.get(normalize_email(email))
+
+    def list_events(self) -> List[Event]:
+        return [self._events[event_id] for _, event_id in self._timeline]
+
+    def events_between(self, start: datetime, end: datetime) -> List[Event]:
+        timeline = self._timeline
+        lo = bisect_left(timeline, (start,))
+        hi = bisect_left(timeline, (end,), lo)
+        return [self._events[event_id] for _, event_id in timeline[lo:hi]]
+
+    def events_after(self, after: Optional[Tuple[datetime, int]], limit: int) -> List[Event]:
+        timeline = self._timeline
+        lo = 0 if after is None else bisect_right(timeline, after)
+        return [self._events[event_id] for _, event_id in timeline[lo:lo + limit]]
+
+    def _timeline_key(self, event_id: int) -> Tuple[datetime, int]:
+        return event_start(self._events[event_id]), event_id
+
+    def _user_event_ids(self, user_id: int) -> Sequence[int]:
+        user = self._users.get(user_id)  # None if deleted since the caller checked
+        return () if user is None else user.event_ids
+
+    def user_events(self, user_id: int) -> List[Event]:
+        # event_ids is kept in timeline order by add_registration.
+        return [self._events[event_id] for event_id in self._user_event_ids(user_id)]
+
+    def user_events_after(self, user_id: int, after: Optional[Tuple[datetime, int]],
+                          limit: int) -> List[Event]:
+        event_ids = self._user_event_ids(user_id)
+        lo = 0 if after is None else bisect_right(event_ids, after, key=self._timeline_key)
+        return [self._events[event_id] for event_id in event_ids[lo:lo + limit]]
+
+    def registrants(self, event_id: int) -> List[User]:
+        # User IDs are allocated in increasing order, so ID order is also the
+        # order of self.users. Users deleted while we read are skipped.
+        users = self._users
+        return [user for user in map(users.get, self._event_registrants[event_id]) if user is not None]
+
+    def registrants_after(self, event_id: int, after_user_id: int, limit: int) -> List[User]:
+        registrants = self._event_registrants[event_id]
+        users: List[User] = []
+        # Refill the page if users were deleted between reading an ID and its row.
+        while len(users) < limit:
+            lo = bisect_right(registrants, after_user_id)
+            user_ids = registrants[lo:lo + limit - len(users)]
+            if not user_ids:
+                break
+            users.extend(user for user in map(self._users.get, user_ids) if user is not None)
+            after_user_id = user_ids[-1]
+        return users
+
+    def registrant_batches(self, event_id: int, batch_size: int) -> Iterator[List[Tuple[int, str, str, str]]]:
+        # Only the sorted IDs are copied up front; rows are built a batch at a time,
+        # skipping users deleted since.
+        user_ids = array("i", self._event_registrants[event_id])
+        users = self._users
+        for start in range(0, len(user_ids), batch_size):
+            batch = []
+            for user_id in user_ids[start:start + batch_size]:
+                user = users.get(user_id)
+                if user is not None:
+                    batch.append((user_id, user.name, user.email, user.phone))
+            if batch:
+                yield batch
+
+    def registration_count(self, event_id: int) -> int:
+        return len(self._event_registrants[event_id])
+
+    def registration_counts(self) -> Dict[int, int]:
+        return {event_id: len(self._event_registrants[event_id]) for event_id in sorted(self._events)}
+
+    def waitlist(self, event_id: int) -> List[int]:
+        return list(self._waitlists[event_id])
+
+    def waitlist_length(self, event_id: int) -> int:
+        return len(self._waitlists[event_id])
+
+    def is_waitlisted(self, event_id: int, user_id: int) -> bool:
+        return user_id in self._waitlists[event_id]
+
+    def waitlisted_event_ids(self, user_id: int) -> List[int]:
+        return list(self._user_waitlists.get(user_id, ()))
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL,
+    date TEXT NOT NULL,
+    time TEXT NOT NULL,
+    location TEXT NOT NULL,
+    capacity INTEGER,
+    starts_at TEXT NOT NULL,
+    registration_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS events_by_start ON events (starts_at, id);
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    email_key TEXT NOT NULL UNIQUE,
+    phone TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS registrations (
+    event_id INTEGER NOT NULL REFERENCES events (id),
+    user_id INTEGER NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+    UNIQUE (event_id, user_id)
+);
+CREATE INDEX IF NOT EXISTS registrations_by_user ON registrations (user_id);
+CREATE TABLE IF NOT EXISTS waitlist (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_id INTEGER NOT NULL REFERENCES events (id),
+    user_id INTEGER NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+    UNIQUE (event_id, user_id)
+);
+CREATE INDEX IF NOT EXISTS waitlist_by_event ON waitlist (event_id, seq);
+CREATE INDEX IF NOT EXISTS waitlist_by_user ON waitlist (user_id);
+CREATE TABLE IF NOT EXISTS id_counters (
+    kind TEXT PRIMARY KEY,
+    next_id INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO id_counters (kind, next_id) VALUES ('event', 1), ('user', 1);
+CREATE TABLE IF NOT EXISTS store_version (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    version INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO store_version (id, version) VALUES (1, 0);
+"""
+
+_START_FORMAT = "%Y-%m-%d %H:%M:%S"  # sorts lexicographically in time order
+
+_EVENT_COLUMNS = "id, name, description, date, time, location, capacity"
+_SELECT_EVENT = f"SELECT {_EVENT_COLUMNS} FROM events WHERE id = ?"
+_SELECT_EVENTS_BY_START = f"SELECT {_EVENT_COLUMNS} FROM events ORDER BY starts_at, id"
+_SELECT_EVENTS_BETWEEN = (f"SELECT {_EVENT_COLUMNS} FROM events "
+                          "WHERE starts_at >= ? AND starts_at < ? ORDER BY starts_at, id")
+_SELECT_USER_EVENTS = ("SELECT e.id, e.name, e.description, e.date, e.time, e.location, e.capacity "
+                       "FROM registrations r JOIN events e ON e.id = r.event_id "
+                       "WHERE r.user_id = ? ORDER BY e.starts_at, e.id")
+# Keyset pages: rows strictly after a (starts_at, id) position.
+_SELECT_EVENTS_AFTER = (f"SELECT {_EVENT_COLUMNS} FROM events "
+                        "WHERE (starts_at, id) > (?, ?) ORDER BY starts_at, id LIMIT ?")
+_SELECT_USER_EVENTS_AFTER = ("SELECT e.id, e.name, e.description, e.date, e.time, e.location, e.capacity "
+                             "FROM registrations r JOIN events e ON e.id = r.event_id "
+                             "WHERE r.user_id = ? AND (e.starts_at, e.id) > (?, ?) "
+                             "ORDER BY e.starts_at, e.id LIMIT ?")
+_SELECT_USER = "SELECT id, name, email, phone FROM users WHERE id = ?"
+_SELECT_USER_EVENT_IDS = "SELECT event_id FROM registrations WHERE user_id = ? ORDER BY rowid"
+_SELECT_REGISTRANTS = ("SELECT u.id, u.name, u.email, u.phone FROM registrations r "
+                       "JOIN users u ON u.id = r.user_id WHERE r.event_id = ? ORDER BY u.id")
+# Keyset pagination over the (event_id, user_id) unique index.
+_SELECT_REGISTRANT_PAGE = ("SELECT u.id, u.name, u.email, u.phone FROM registrations r "
+                           "JOIN users u ON u.id = r.user_id WHERE r.event_id = ? AND r.user_id > ? "
+                           "ORDER BY r.user_id LIMIT ?")
+# Per-event counts are kept in events.registration_count so seat checks are O(1).
+_COUNT_REGISTRATIONS = "SELECT registration_count FROM events WHERE id = ?"
+_COUNT_ALL_REGISTRATIONS = "SELECT id, registration_count FROM events ORDER BY id"
+_INCREMENT_COUNT = "UPDATE events SET registration_count = registration_count + 1 WHERE id = ?"
+_DECREMENT_USER_COUNTS = ("UPDATE events SET registration_count = registration_count - 1 "
+                          "WHERE id IN (SELECT event_id FROM registrations WHERE user_id = ?)")
+_FIND_USER = "SELECT id FROM users WHERE email_key = ?"
+_INSERT_EVENT = f"INSERT INTO events ({_EVENT_COLUMNS}, starts_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+_INSERT_USER = "INSERT INTO users (id, name, email, email_key, phone) VALUES (?, ?, ?, ?, ?)"
+_INSERT_REGISTRATION = "INSERT OR IGNORE INTO registrations (event_id, user_id) VALUES (?, ?)"
+_DELETE_USER = "DELETE FROM users WHERE id = ?"
+_INSERT_WAITLIST = "INSERT OR IGNORE INTO waitlist (event_id, user_id) VALUES (?, ?)"
+_SELECT_WAITLIST_HEAD = "SELECT seq, user_id FROM waitlist WHERE event_id = ? ORDER BY seq LIMIT 1"
+_DELETE_WAITLIST_ENTRY = "DELETE FROM waitlist WHERE seq = ?"
+_SELECT_WAITLIST = "SELECT user_id FROM waitlist WHERE event_id = ? ORDER BY seq"
+_COUNT_WAITLIST = "SELECT COUNT(*) FROM waitlist WHERE event_id = ?"
+_IS_WAITLISTED = "SELECT 1 FROM waitlist WHERE event_id = ? AND user_id = ?"
+_SELECT_USER_WAITLISTS = "SELECT event_id FROM waitlist WHERE user_id = ? ORDER BY seq"
+_SELECT_NEXT_ID = "SELECT next_id FROM id_counters WHERE kind = ?"
+_ADVANCE_ID = "UPDATE id_counters SET next_id = MAX(next_id, ?) WHERE kind = ?"
+# Bumped in the same transaction as every mutation, so all processes see one stamp.
+_SELECT_VERSION = "SELECT version FROM store_version"
+_BUMP_VERSION = "UPDATE store_version SET version = version + 1"
+
+
+def _after_params(after: Optional[Tuple[datetime, int]]) -> Tuple[str, int]:
+    """SQL parameters for a keyset position; None sorts before every event."""
+    if after is None:
+        return "", 0
+    return after[0].strftime(_START_FORMAT), after[1]
+
+
+class _SQLiteEvents(Mapping):
+    """Read-only event_id -> Event view over the events table."""
+
+    def __init__(self, storage: "SQLiteStorage"):
+        self._storage = storage
+
+    def __getitem__(self, event_id: int) -> Event:
+        row = self._storage._conn().execute(_SELECT_EVENT, (event_id,)).fetchone()
+        if row is None:
+            raise KeyError(event_id)
+        return Event(*row)
+
+    def __contains__(self, event_id: object) -> bool:
+        return self._storage._conn().execute(
+            "SELECT 1 FROM events WHERE id = ?", (event_id,)).fetchone() is not None
+
+    def __iter__(self) -> Iterator[int]:
+        rows = self._storage._conn().execute("SELECT id FROM events ORDER BY id").fetchall()
+        return (row[0] for row in rows)
+
+    def __len__(self) -> int:
+        return self._storage._conn().execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+
+class _SQLiteUsers(Mapping):
+    """Read-only user_id -> User view over the users table."""
+
+    def __init__(self, storage: "SQLiteStorage"):
+        self._storage = storage
+
+    def __getitem__(self, user_id: int) -> User:
+        conn = self._storage._conn()
+        row = conn.execute(_SELECT_USER, (user_id,)).fetchone()
+        if row is None:
+            raise KeyError(user_id)
+        event_ids = [r[0] for r in conn.execute(_SELECT_USER_EVENT_IDS, (user_id,))]
+        return User(*row, event_ids)
+
+    def __contains__(self, user_id: object) -> bool:
+        return self._storage._conn().execute(
+            "SELECT 1 FROM users WHERE id = ?", (user_id,)).fetchone() is not None
+
+    def __iter__(self) -> Iterator[int]:
+        rows = self._storage._conn().execute("SELECT id FROM users ORDER BY id").fetchall()
+        return (row[0] for row in rows)
+
+    def __len__(self) -> int:
+        return self._storage._conn().execute("SELECT COUNT(*) FROM users").fetchone()[0]
+
+
+class SQLiteStorage(RegistrationStorage):
+    """
+    SQLite storage for datasets larger than RAM or shared between app workers.
+
+    The database runs in WAL mode so readers never block the single writer, and
+    email, event and registration lookups are served by indexes. Each thread
+    gets its own connection; statements are parameterized constants, so
+    sqlite3's per-connection statement cache reuses their prepared form.
+    """
+
+    def __init__(self, path: str, timeout: float = 30.0):
+        """
+        Open (or create) a SQLite registration database.
+
+        Args:
+            path (str): Path of the database file. ":memory:" is not supported
+                because every thread opens its own connection.
+            timeout (float): Seconds to wait for another writer's lock
+        """
+        if path == ":memory:":
+            raise ValueError("SQLiteStorage needs a file path; use MemoryStorage for in-memory data")
+        self.path = os.path.abspath(path)
+        self.timeout = timeout
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._events = _SQLiteEvents(self)
+        self._users = _SQLiteUsers(self)
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # isolation_level=None: autocommit, transactions are managed explicitly.
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None,
+                                   cached_statements=256)
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.depth = 0
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    @property
+    def events(self) -> Mapping[int, Event]:
+        return self._events
+
+    @property
+    def users(self) -> Mapping[int, User]:
+        return self._users
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        conn = self._conn()
+        if self._local.depth:
+            self._local.depth += 1
+            try:
+                yield
+            finally:
+                self._local.depth -= 1
+            return
+        # IMMEDIATE takes the write lock up front, so checks made inside the
+        # transaction still hold when its writes commit.
+        conn.execute("BEGIN IMMEDIATE")
+        self._local.depth = 1
+        try:
+            yield
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        else:
+            conn.execute("COMMIT")
+        finally:
+            self._local.depth = 0
+
+    def version(self) -> int:
+        return self._conn().execute(_SELECT_VERSION).fetchone()[0]
+
+    def next_id(self, kind: str) -> int:
+        return self._conn().execute(_SELECT_NEXT_ID, (kind,)).fetchone()[0]
+
+    def allocate_id(self, kind: str) -> int:
+        with self.transaction():
+            next_id = self.next_id(kind)
+            self.advance_id(kind, next_id + 1)
+        return next_id
+
+    def advance_id(self, kind: str, next_id: int) -> None:
+        self._conn().execute(_ADVANCE_ID, (next_id, kind))
+
+    def add_event(self, event: Event) -> None:
+        with self.transaction():
+            self._conn().execute(_INSERT_EVENT, (
+                event.id, event.name, event.description, event.date, event.time, event.location,
+                event.capacity, event_start(event).strftime(_START_FORMAT)))
+            self.advance_id("event", event.id + 1)
+            self._conn().execute(_BUMP_VERSION)
+
+    def add_user(self, user_id: int, name: str, email: str, phone: str) -> None:
+        with self.transaction():
+            self._conn().execute(_INSERT_USER, (user_id, name, email, normalize_email(email), phone))
+            self.advance_id("user", user_id + 1)
+            self._conn().execute(_BUMP_VERSION)
+
+    def add_registration(self, event_id: int, user_id: int) -> None:
+        with self.transaction():
+            conn = self._conn()
+            if conn.execute(_INSERT_REGISTRATION, (event_id, user_id)).rowcount:
+                conn.execute(_INCREMENT_COUNT, (event_id,))
+                conn.execute(_BUMP_VERSION)
+
+    def remove_user(self, user_id: int) -> None:
+        with self.transaction():
+            conn = self._conn()
+            conn.execute(_DECREMENT_USER_COUNTS, (user_id,))
+            # Registrations and waitlist entries cascade.
+            conn.execute(_DELETE_USER, (user_id,))
+            conn.execute(_BUMP_VERSION)
+
+    def add_to_waitlist(self, event_id: int, user_id: int) -> None:
+        with self.transaction():
+            conn = self._conn()
+            if conn.execute(_INSERT_WAITLIST, (event_id, user_id)).rowcount:
+                conn.execute(_BUMP_VERSION)
+
+    def pop_waitlist(self, event_id: int) -> Optional[int]:
+        with self.transaction():
+            conn = self._conn()
+            row = conn.execute(_SELECT_WAITLIST_HEAD, (event_id,)).fetchone()
+            if row is None:
+                return None
+            conn.execute(_DELETE_WAITLIST_ENTRY, (row[0],))
+            conn.execute(_BUMP_VERSION)
+        return row[1]
+
+    def clear(self) -> None:
+        with self.transaction():
+            conn = self._conn()
+            conn.execute("DELETE FROM waitlist")
+            conn.execute("DELETE FROM registrations")
+            conn.execute("DELETE FROM users")
+            conn.execute("DELETE FROM events")
+            conn.execute(_BUMP_VERSION)
+
+    def find_user_id(self, email: str) -> Optional[int]:
+        row = self._conn().execute(_FIND_USER, (normalize_email(email),)).fetchone()
+        return row[0] if row else None
+
+    def list_events(self) -> List[Event]:
+        return [Event(*row) for row in self._conn().execute(_SELECT_EVENTS_BY_START)]
+
+    def events_between(self, start: datetime, end: datetime) -> List[Event]:
+        params = (start.strftime(_START_FORMAT), end.strftime(_START_FORMAT))
+        return [Event(*row) for row in self._conn().execute(_SELECT_EVENTS_BETWEEN, params)]
+
+    def events_after(self, after: Optional[Tuple[datetime, int]], limit: int) -> List[Event]:
+        params = _after_params(after) + (limit,)
+        return [Event(*row) for row in self._conn().execute(_SELECT_EVENTS_AFTER, params)]
+
+    def user_events(self, user_id: int) -> List[Event]:
+        return [Event(*row) for row in self._conn().execute(_SELECT_USER_EVENTS, (user_id,))]
+
+    def user_events_after(self, user_id: int, after: Optional[Tuple[datetime, int]],
+                          limit: int) -> List[Event]:
+        params = (user_id,) + _after_params(after) + (limit,)
+        return [Event(*row) for row in self._conn().execute(_SELECT_USER_EVENTS_AFTER, params)]
+
+    def _users_with_events(self, rows: List[Tuple[int, str, str, str]]) -> List[User]:
+        conn = self._conn()
+        users = []
+        for row in rows:
+            event_ids = [r[0] for r in conn.execute(_SELECT_USER_EVENT_IDS, (row[0],))]
+            users.append(User(*row, event_ids))
+        return users
+
+    def registrants(self, event_id: int) -> List[User]:
+        return self._users_with_events(self._conn().execute(_SELECT_REGISTRANTS, (event_id,)).fetchall())
+
+    def registrants_after(self, event_id: int, after_user_id: int, limit: int) -> List[User]:
+        rows = self._conn().execute(_SELECT_REGISTRANT_PAGE, (event_id, after_user_id, limit)).fetchall()
+        return self._users_with_events(rows)
+
+    def registrant_batches(self, event_id: int, batch_size: int) -> Iterator[List[Tuple[int, str, str, str]]]:
+        after = 0
+        while True:
+            rows = self._conn().execute(_SELECT_REGISTRANT_PAGE, (event_id, after, batch_size)).fetchall()
+            if rows:
+                yield rows
+            if len(rows) < batch_size:
+                return
+            after = rows[-1][0]
+
+    def registration_count(self, event_id: int) -> int:
+        return self._conn().execute(_COUNT_REGISTRATIONS, (event_id,)).fetchone()[0]
+
+    def registration_counts(self) -> Dict[int, int]:
+        return dict(self._conn().execute(_COUNT_ALL_REGISTRATIONS).fetchall())
+
+    def waitlist(self, event_id: int) -> List[int]:
+        return [row[0] for row in self._conn().execute(_SELECT_WAITLIST, (event_id,))]
+
+    def waitlist_length(self, event_id: int) -> int:
+        return self._conn().execute(_COUNT_WAITLIST, (event_id,)).fetchone()[0]
+
+    def is_waitlisted(self, event_id: int, user_id: int) -> bool:
+        return self._conn().execute(_IS_WAITLISTED, (event_id, user_id)).fetchone() is not None
+
+    def waitlisted_event_ids(self, user_id: int) -> List[int]:
+        return [row[0] for row in self._conn().execute(_SELECT_USER_WAITLISTS, (user_id,))]
+
+    def close(self) -> None:
+        """Close the connections opened by every thread."""
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
@@ -0,0 +1,374 @@
+"""
+HTML rendering for the registration UI.
+
+Page layouts are string.Template objects compiled once at import, values are
+HTML-escaped as they are substituted, and per-event fragments are cached and
+re-rendered only when the event (or, for the details block, its registration
+count) changes.
+"""
+from html import escape
+from string import Template
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from registration_models import Event, User
+
+
+class FragmentCache:
+    """
+    Rendered HTML fragments keyed by ID, each stored with a stamp of the data it
+    was rendered from. A lookup with a different stamp re-renders the fragment,
+    so changed events are never served stale.
+    """
+
+    def __init__(self, render: Callable[..., str], max_entries: int = 4096):
+        self._render = render
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[Hashable, str]] = {}
+
+    def get(self, key: Hashable, stamp: Hashable, *args: Any) -> str:
+        """Return the fragment for key, rendering it with args if missing or stale."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+        fragment = self._render(*args)
+        if key not in self._entries and len(self._entries) >= self.max_entries:
+            self._entries.clear()
+        self._entries[key] = (stamp, fragment)
+        return fragment
+
+    def clear(self) -> None:
+        """Drop every cached fragment."""
+        self._entries.clear()
+
+
+def _escaped(**values: Any) -> Dict[str, str]:
+    """HTML-escape template values; markup fragments are passed to substitute separately."""
+    return {key: escape(str(value)) for key, value in values.items()}
+
+
+def _fill(template: Template, **values: Any) -> str:
+    """Substitute HTML-escaped values into a template."""
+    return template.substitute(_escaped(**values))
+
+
+def event_stamp(event: Event) -> Tuple:
+    """Everything an event fragment is rendered from."""
+    return event.id, event.name, event.description, event.date, event.time, event.location, event.capacity
+
+
+# Home page
+
+_EVENT_CARD = Template("""
+        <div style='border: 2px solid #4CAF50; padding: 15px; border-radius: 8px; background: #f9f9f9;'>
+            <h3 style='color: #2c3e50; margin-top: 0;'>$name</h3>
+            <p><strong>Date:</strong> $date</p>
+            <p><strong>Time:</strong> $time</p>
+            <p><strong>Location:</strong> $location</p>
+            <p style='color: #555;'>$summary...</p>
+            <p style='color: #888; font-size: 0.9em; margin-top: 10px;'>
+                <em>Click "View Event $id" button below to register</em>
+            </p>
+        </div>
+        """)
+
+_USER_INFO = Template("""
+            <div style='background: #e8f5e9; padding: 15px; margin-bottom: 20px; border-radius: 8px; border: 2px solid #4CAF50;'>
+                <h3 style='color: #2e7d32; margin-top: 0;'>✓ Logged in as: $name</h3>
+                <p style='margin: 5px 0;'><strong>Email:</strong> $email</p>
+                <p style='color: #666; margin-bottom: 0;'>Use the buttons below to view your registrations or reports</p>
+            </div>
+            """)
+
+_MORE_EVENTS = "<p style='color: #666; text-align: center;'>More events available, click <strong>Next Page</strong> to see them</p>"
+
+_HOME_PAGE = Template("""
+    <div style='max-width: 1200px; margin: 0 auto;'>
+        <h1 style='color: #1976d2; text-align: center;'>🎉 Event Registration System</h1>
+        $user_info
+        <h2 style='color: #424242; border-bottom: 2px solid #1976d2; padding-bottom: 10px;'>$heading</h2>
+        $event_grid
+        <div style='margin-top: 30px; padding: 20px; background: #f5f5f5; border-radius: 8px;'>
+            <h3 style='color: #424242;'>Quick Actions</h3>
+            <p style='color: #666;'>Use the buttons below to navigate:</p>
+            <ul style='color: #666;'>
+                <li>Click <strong>View Event 1-6</strong> buttons to see event details and register</li>
+                <li>Click <strong>My Registrations</strong> to see your registered events</li>
+                <li>Click <strong>View Report</strong> to see registration statistics</li>
+                <li>Click <strong>Delete Account</strong> to remove your account</li>
+            </ul>
+        </div>
+    </div>
+    """)
+
+
+def _render_event_card(event: Event) -> str:
+    return _fill(_EVENT_CARD, id=event.id, name=event.name, date=event.date, time=event.time,
+                 location=event.location, summary=event.description[:80])
+
+
+_event_cards = FragmentCache(_render_event_card)
+
+
+def render_user_info(user: Optional[User]) -> str:
+    """Signed-in banner for the home page, empty when nobody is signed in."""
+    if user is None:
+        return ""
+    return _fill(_USER_INFO, name=user.name, email=user.email)
+
+
+def render_home_page(heading: str, events: Iterable[Event], user: Optional[User] = None,
+                     has_more: bool = False) -> str:
+    """
+    Render the home page.
+
+    Args:
+        heading (str): Grid heading (plain text)
+        events (Iterable[Event]): Events on this page of the grid
+        user (User | None): Signed-in user
+        has_more (bool): Whether a next page of events exists
+    """
+    cards = "".join(_event_cards.get(event.id, event_stamp(event), event) for event in events)
+    grid = ("<div style='display: grid; grid-template-columns: repeat(2, 1fr); gap: 20px;'>"
+            + cards + "</div>" + (_MORE_EVENTS if has_more else ""))
+    return _HOME_PAGE.substitute(_escaped(heading=heading), user_info=render_user_info(user), event_grid=grid)
+
+
+# Event page
+
+EVENT_NOT_FOUND = """
+        <div style='max-width: 800px; margin: 0 auto; padding: 20px;'>
+            <h2 style='color: #d32f2f;'>❌ Event not found</h2>
+            <p>The requested event does not exist.</p>
+            <p style='color: #666;'>Click the <strong>Home</strong> button to return to the event list.</p>
+        </div>
+        """
+
+_SEATS = Template("<p><strong style='color: #424242;'>🎟️ Seats:</strong> $registered / $capacity taken</p>")
+
+_EVENT_DETAILS = Template("""
+        <h1 style='color: #1976d2;'>$name</h1>
+        <div style='background: #f5f5f5; padding: 20px; border-radius: 8px; margin-bottom: 20px; border-left: 4px solid #1976d2;'>
+            <p><strong style='color: #424242;'>Description:</strong> $description</p>
+            <p><strong style='color: #424242;'>📅 Date:</strong> $date</p>
+            <p><strong style='color: #424242;'>🕐 Time:</strong> $time</p>
+            <p><strong style='color: #424242;'>📍 Location:</strong> $location</p>
+            $seats
+        </div>""")
+
+_ALREADY_REGISTERED = """
+        <div style='background: #fff3cd; padding: 20px; border-radius: 8px; border: 2px solid #ffc107; margin-top: 20px;'>
+            <h3 style='color: #856404; margin-top: 0;'>✓ You are already registered for this event!</h3>
+            <p style='color: #856404; margin-bottom: 0;'>Check "My Registrations" to see all your events.</p>
+        </div>
+        """
+
+_REGISTER_PROMPT = """
+        <div style='background: #e3f2fd; padding: 20px; border-radius: 8px; border: 2px solid #2196F3; margin-top: 20px;'>
+            <h3 style='color: #1565c0; margin-top: 0;'>📝 Register for this Event</h3>
+            <p style='color: #666;'>Fill in the form below and click the <strong>Register</strong> button at the bottom.</p>
+        </div>
+        """
+
+_EVENT_PAGE = Template("""
+    <div style='max-width: 800px; margin: 0 auto; padding: 20px;'>$details
+
+        $registration_form
+
+        <div style='margin-top: 30px; padding: 15px; background: #fffde7; border-radius: 8px;'>
+            <p style='color: #f57f17; margin: 0;'><strong>💡 Tip:</strong> Click the <strong>Home</strong> button below to return to the event list.</p>
+        </div>
+    </div>
+    """)
+
+
+def _render_event_details(event: Event, registered: Optional[int]) -> str:
+    seats = "" if event.capacity is None else _fill(_SEATS, registered=registered, capacity=event.capacity)
+    values = _escaped(name=event.name, description=event.description, date=event.date,
+                      time=event.time, location=event.location)
+    return _EVENT_DETAILS.substitute(values, seats=seats)
+
+
+_event_details = FragmentCache(_render_event_details)
+
+
+def render_event_page(event: Event, registered: Optional[int], already_registered: bool) -> str:
+    """
+    Render an event's details page.
+
+    Args:
+        event (Event): The event
+        registered (int | None): Current registration count, shown for events with a capacity
+        already_registered (bool): Whether the signed-in user is registered for it
+    """
+    if event.capacity is None:
+        registered = None
+    details = _event_details.get(event.id, (event_stamp(event), registered), event, registered)
+    form = _ALREADY_REGISTERED if already_registered else _REGISTER_PROMPT
+    return _EVENT_PAGE.substitute(details=details, registration_form=form)
+
+
+# My registrations page
+
+NO_ACCOUNT = """
+        <div style='max-width: 800px; margin: 0 auto; padding: 20px;'>
+            <h2 style='color: #f57c00;'>⚠️ No Active Account</h2>
+            <p>Please register for an event first to create your account.</p>
+            <p style='color: #666;'>Click the <strong>Home</strong> button to browse events and register.</p>
+        </div>
+        """
+
+_NO_REGISTRATIONS = Template("""
+        <div style='max-width: 800px; margin: 0 auto; padding: 20px;'>
+            <h1 style='color: #1976d2;'>My Event Registrations</h1>
+            <div style='background: #e8f5e9; padding: 15px; border-radius: 8px; border: 2px solid #4CAF50; margin-bottom: 20px;'>
+                <p style='margin: 0;'><strong>Account:</strong> $name ($email)</p>
+            </div>
+            <div style='background: #fff3cd; padding: 20px; border-radius: 8px; border: 2px solid #ffc107;'>
+                <h3 style='color: #856404; margin-top: 0;'>No registrations found</h3>
+                <p style='color: #856404; margin-bottom: 0;'>You haven't registered for any events yet. Click <strong>Home</strong> to browse events.</p>
+            </div>
+        </div>
+        """)
+
+_REGISTERED_EVENT = Template("""
+        <div style='border: 2px solid #4CAF50; padding: 20px; border-radius: 8px; background: #f1f8f4; margin-bottom: 15px;'>
+            <h3 style='color: #2e7d32; margin-top: 0;'>✓ $name</h3>
+            <p><strong>📅 Date:</strong> $date at $time</p>
+            <p><strong>📍 Location:</strong> $location</p>
+            <p style='color: #555;'>$description</p>
+        </div>
+        """)
+
+_MY_REGISTRATIONS = Template("""
+    <div style='max-width: 800px; margin: 0 auto; padding: 20px;'>
+        <h1 style='color: #1976d2;'>My Event Registrations</h1>
+        <div style='background: #e8f5e9; padding: 15px; border-radius: 8px; border: 2px solid #4CAF50; margin-bottom: 20px;'>
+            <p style='margin: 5px 0;'><strong>Account:</strong> $name</p>
+            <p style='margin: 5px 0;'><strong>Email:</strong> $email</p>
+            <p style='margin: 5px 0;'><strong>Phone:</strong> $phone</p>
+        </div>
+        <h2 style='color: #424242;'>Registered Events ($count)</h2>
+        $events
+        <div style='margin-top: 20px; padding: 15px; background: #e3f2fd; border-radius: 8px;'>
+            <p style='color: #1565c0; margin: 0;'><strong>💡 Tip:</strong> Click <strong>Home</strong> to view more events or <strong>Delete Account</strong> to remove all registrations.</p>
+        </div>
+    </div>
+    """)
+
+
+def _render_registered_event(event: Event) -> str:
+    return _fill(_REGISTERED_EVENT, name=event.name, date=event.date, time=event.time,
+                 location=event.location, description=event.description)
+
+
+_registered_events = FragmentCache(_render_registered_event)
+
+
+def render_my_registrations(user: User, events: List[Event]) -> str:
+    """Render the list of events a user is registered for."""
+    if not events:
+        return _fill(_NO_REGISTRATIONS, name=user.name, email=user.email)
+    cards = "".join(_registered_events.get(event.id, event_stamp(event), event) for event in events)
+    values = _escaped(name=user.name, email=user.email, phone=user.phone, count=len(events))
+    return _MY_REGISTRATIONS.substitute(values, events=cards)
+
+
+# Report page
+
+NO_REPORT_DATA = """
+        <div style='max-width: 1000px; margin: 0 auto; padding: 20px;'>
+            <h2 style='color: #f57c00;'>No registration data available</h2>
+            <p>No one has registered for any events yet.</p>
+            <p style='color: #666;'>Click the <strong>Home</strong> button to return to the event list.</p>
+        </div>
+        """
+
+_REPORT_TABLE_HEAD = """
+    <table style='width: 100%; border-collapse: collapse; background: white; box-shadow: 0 2px 4px rgba(0,0,0,0.1);'>
+        <thead>
+            <tr style='background: #1976d2; color: white;'>
+                <th style='padding: 15px; text-align: left; border: 1px solid #ddd;'>Event ID</th>
+                <th style='padding: 15px; text-align: left; border: 1px solid #ddd;'>Event Name</th>
+                <th style='padding: 15px; text-align: center; border: 1px solid #ddd;'>Registrations</th>
+            </tr>
+        </thead>
+        <tbody>
+    """
+
+_REPORT_ROW = Template("""
+        <tr style='background: $background;'>
+            <td style='padding: 12px 15px; border: 1px solid #ddd;'>$event_id</td>
+            <td style='padding: 12px 15px; border: 1px solid #ddd;'>$event_name</td>
+            <td style='padding: 12px 15px; text-align: center; border: 1px solid #ddd; font-weight: bold; color: #1976d2;'>$registrations</td>
+        </tr>
+        """)
+
+_REPORT_PAGE = Template("""
+    <div style='max-width: 1000px; margin: 0 auto; padding: 20px;'>
+        <h1 style='color: #1976d2;'>📊 Registration Report</h1>
+        <div style='background: #e8f5e9; padding: 15px; border-radius: 8px; margin-bottom: 20px; border: 2px solid #4CAF50;'>
+            <h3 style='color: #2e7d32; margin: 5px 0;'>Summary Statistics</h3>
+            <p style='margin: 5px 0;'><strong>Total Events:</strong> $events</p>
+            <p style='margin: 5px 0;'><strong>Total Registrations:</strong> $registrations</p>
+            <p style='margin: 5px 0;'><strong>Average Registrations per Event:</strong> $average</p>
+        </div>
+        <h2 style='color: #424242;'>Detailed Breakdown</h2>
+        $table
+        <div style='margin-top: 20px; padding: 15px; background: #fffde7; border-radius: 8px;'>
+            <p style='color: #f57f17; margin: 0;'><strong>💡 Tip:</strong> Click <strong>Home</strong> to return to the event list.</p>
+        </div>
+    </div>
+    """)
+
+
+def render_report_page(report: List[Dict]) -> str:
+    """Render the registration report from EventRegistration.get_detailed_report."""
+    if not report:
+        return NO_REPORT_DATA
+    total = sum(item["registrations"] for item in report)
+    rows = "".join(_fill(_REPORT_ROW, background="#f9f9f9" if item["registrations"] > 0 else "#fff",
+                         event_id=item["event_id"], event_name=item["event_name"],
+                         registrations=item["registrations"])
+                   for item in report)
+    values = _escaped(events=len(report), registrations=total, average=f"{total / len(report):.1f}")
+    return _REPORT_PAGE.substitute(values, table=_REPORT_TABLE_HEAD + rows + "</tbody></table>")
+
+
+# Delete account page
+
+NO_ACCOUNT_TO_DELETE = """
+        <div style='max-width: 800px; margin: 0 auto; padding: 20px;'>
+            <h2 style='color: #f57c00;'>No account to delete</h2>
+            <p>You don't have an active account.</p>
+            <p style='color: #666;'>Click the <strong>Home</strong> button to browse events and register.</p>
+        </div>
+        """
+
+_DELETE_ACCOUNT = Template("""
+    <div style='max-width: 800px; margin: 0 auto; padding: 20px;'>
+        <h1 style='color: #d32f2f;'>⚠️ Delete Account</h1>
+        <div style='background: #ffebee; padding: 20px; border-radius: 8px; border: 2px solid #f44336; margin-bottom: 20px;'>
+            <h3 style='color: #c62828; margin-top: 0;'>Warning: This action cannot be undone!</h3>
+            <p style='color: #c62828;'><strong>Account Details:</strong></p>
+            <ul style='color: #c62828;'>
+                <li>Name: $name</li>
+                <li>Email: $email</li>
+                <li>Phone: $phone</li>
+                <li>Registered Events: $event_count</li>
+            </ul>
+            <p style='color: #c62828; margin-bottom: 0;'>
+                Deleting your account will permanently remove all your event registrations.
+                This action cannot be undone.
+            </p>
+        </div>
+
+        <div style='background: #e3f2fd; padding: 15px; border-radius: 8px; margin-bottom: 20px;'>
+            <p style='color: #1565c0; margin: 0;'><strong>💡 Tip:</strong> Click the <strong>Confirm Delete</strong> button below to permanently delete your account, or click <strong>Home</strong> to cancel.</p>
+        </div>
+    </div>
+    """)
+
+
+def render_delete_account_page(user: User, event_count: int) -> str:
+    """Render the account deletion confirmation page."""
+    return _fill(_DELETE_ACCOUNT, name=user.name, email=user.email, phone=user.phone, event_count=event_count)
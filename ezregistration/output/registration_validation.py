@@ -0,0 +1,138 @@
+import re
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from typing import Optional, List, Iterable, Tuple
+
+
+class ValidationCode(str, Enum):
+    """Structured reasons a registration or event is rejected."""
+    NAME_EMPTY = "name_empty"
+    EMAIL_EMPTY = "email_empty"
+    PHONE_EMPTY = "phone_empty"
+    EMAIL_INVALID = "email_invalid"
+    PHONE_LENGTH = "phone_length"
+    PHONE_NOT_DIGITS = "phone_not_digits"
+    DATE_INVALID = "date_invalid"
+    TIME_INVALID = "time_invalid"
+
+    @property
+    def message(self) -> str:
+        """Human-readable message for this code."""
+        return _MESSAGES[self]
+
+
+_MESSAGES = {
+    ValidationCode.NAME_EMPTY: "Name cannot be empty",
+    ValidationCode.EMAIL_EMPTY: "Email cannot be empty",
+    ValidationCode.PHONE_EMPTY: "Phone cannot be empty",
+    ValidationCode.EMAIL_INVALID: "Invalid email format",
+    ValidationCode.PHONE_LENGTH: "Phone number must be 10-15 digits",
+    ValidationCode.PHONE_NOT_DIGITS: "Phone number must contain only digits",
+    ValidationCode.DATE_INVALID: "Invalid date format. Use YYYY-MM-DD",
+    ValidationCode.TIME_INVALID: "Invalid time format. Use HH:MM",
+}
+
+_NON_DIGITS = re.compile(r"\D")
+# Deletes every ASCII non-digit, for the common case of ASCII phone numbers.
+_ASCII_NON_DIGITS = {code: None for code in range(128) if not chr(code).isdigit()}
+_ISO_DATE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+_ISO_TIME = re.compile(r"[0-9]{2}:[0-9]{2}")
+
+
+def phone_digits(phone: str) -> str:
+    """Return the digits of a phone number, dropping separators such as spaces and '+'."""
+    if phone.isascii():
+        if phone.isdigit():
+            return phone
+        return phone.translate(_ASCII_NON_DIGITS)
+    return _NON_DIGITS.sub("", phone)
+
+
+def validate_registration(name: str, email: str, phone: str) -> Optional[ValidationCode]:
+    """
+    Validate one set of registration fields.
+
+    Args:
+        name (str): User's full name
+        email (str): User's email address
+        phone (str): User's phone number
+
+    Returns:
+        ValidationCode | None: The first problem found, or None if the data is valid
+    """
+    # Check non-empty
+    if not name or not name.strip():
+        return ValidationCode.NAME_EMPTY
+    if not email or not email.strip():
+        return ValidationCode.EMAIL_EMPTY
+    if not phone or not phone.strip():
+        return ValidationCode.PHONE_EMPTY
+
+    # Email validation: simple check for @ and .
+    if "@" not in email or "." not in email:
+        return ValidationCode.EMAIL_INVALID
+
+    # Phone validation: digits only, 10-15 characters
+    digits = phone_digits(phone)
+    if len(digits) < 10 or len(digits) > 15:
+        return ValidationCode.PHONE_LENGTH
+    if not digits.isdigit():
+        return ValidationCode.PHONE_NOT_DIGITS
+
+    return None
+
+
+def validate_registrations(records: Iterable[Tuple[str, str, str]]) -> List[Optional[ValidationCode]]:
+    """
+    Validate many (name, email, phone) records at once.
+
+    Args:
+        records (Iterable[tuple[str, str, str]]): Records to validate
+
+    Returns:
+        list[ValidationCode | None]: One result per record, None for valid records
+    """
+    validate = validate_registration
+    return [validate(name, email, phone) for name, email, phone in records]
+
+
+class EventTimeError(ValueError):
+    """Raised when an event date or time cannot be parsed."""
+
+    def __init__(self, code: ValidationCode):
+        super().__init__(code.message)
+        self.code = code
+
+
+@lru_cache(maxsize=4096)
+def parse_event_start(date: str, time: str) -> datetime:
+    """
+    Parse an event's date (YYYY-MM-DD) and time (HH:MM) into its start datetime.
+
+    Results are cached, so validating an event and indexing it parse only once.
+
+    Raises:
+        EventTimeError: If the date or time is invalid
+    """
+    # Fast path for zero-padded ISO values; anything else goes through strptime,
+    # which also accepts forms like "2024-6-5" and "9:30".
+    if _ISO_DATE.fullmatch(date) and _ISO_TIME.fullmatch(time):
+        try:
+            day = datetime(int(date[:4]), int(date[5:7]), int(date[8:]))
+        except ValueError:
+            raise EventTimeError(ValidationCode.DATE_INVALID) from None
+        hour, minute = int(time[:2]), int(time[3:])
+        if hour > 23 or minute > 59:
+            raise EventTimeError(ValidationCode.TIME_INVALID)
+        return day.replace(hour=hour, minute=minute)
+
+    try:
+        day = datetime.strptime(date, "%Y-%m-%d")
+    except ValueError:
+        raise EventTimeError(ValidationCode.DATE_INVALID) from None
+    try:
+        moment = datetime.strptime(time, "%H:%M")
+    except ValueError:
+        raise EventTimeError(ValidationCode.TIME_INVALID) from None
+    return day.replace(hour=moment.hour, minute=moment.minute)
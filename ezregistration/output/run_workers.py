@@ -0,0 +1,55 @@
+"""
+Run several event registration app workers that share one SQLite store.
+
+Run from this directory:
+
+    python run_workers.py --workers 4 --base-port 7866
+
+Worker i listens on base_port + i. Put the workers behind a load balancer with
+sticky sessions, since Gradio keeps each session's event queue in the worker
+that served it. Duplicate-email and capacity checks run inside SQLite write
+transactions, so they stay consistent across workers.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+from event_registration import EventRegistration
+from registration_storage import SQLiteStorage
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--base-port", type=int, default=7866)
+    parser.add_argument("--db", default=os.path.join("registration_data", "registrations.db"))
+    args = parser.parse_args()
+
+    db_path = os.path.abspath(args.db)
+    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    # Create the schema and sample events once, before the workers start.
+    storage = SQLiteStorage(db_path)
+    EventRegistration(storage=storage)
+    storage.close()
+
+    workers = []
+    for i in range(args.workers):
+        env = dict(os.environ, EZREG_DB=db_path, EZREG_PORT=str(args.base_port + i))
+        workers.append(subprocess.Popen([sys.executable, "app.py"], cwd=HERE, env=env))
+        print(f"Worker {i + 1} on port {args.base_port + i}")
+
+    try:
+        for worker in workers:
+            worker.wait()
+    except KeyboardInterrupt:
+        for worker in workers:
+            worker.terminate()
+        for worker in workers:
+            worker.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,9 +3,25 @@ To proceed with testing, I will simplify the unit test script to run standalone
 I'll output the valid `test_event_registration.py` script for you to use:
 
 ```python
+import asyncio
+import io
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
 import unittest
+from dataclasses import asdict
 from datetime import datetime
+from async_event_registration import AsyncEventRegistration
+from benchmark_event_registration import run_suite
 from event_registration import EventRegistration, Event, User
+from registration_journal import RegistrationJournal
+from registration_metrics import RegistrationMetrics
+import registration_templates
+from registration_storage import SQLiteStorage
+from registration_validation import ValidationCode, parse_event_start
 
 class TestEventRegistration(unittest.TestCase):
     def setUp(self):
@@ -56,6 +72,36 @@ class TestEventRegistration(unittest.TestCase):
                 location="Somewhere"
             )
 
+    def test_search_events(self):
+        self.assertEqual([e.id for e in self.event_reg.search_events("workshop")], [1, 3])
+        self.assertEqual([e.id for e in self.event_reg.search_events("innov")], [3])
+        self.assertEqual([e.id for e in self.event_reg.search_events("LAB")], [3, 6])
+        self.assertEqual(self.event_reg.search_events("workshop metaverse"), [])
+        self.assertEqual(self.event_reg.search_events("   "), [])
+
+    def test_search_finds_created_event_and_ranks_name_first(self):
+        event = self.event_reg.create_event("Robotics Lab Night", "Build robots", "2025-08-15", "18:00", "Garage")
+        results = self.event_reg.search_events("lab")
+        self.assertEqual(results[0].id, event.id)
+        self.assertEqual(len(self.event_reg.search_events("lab", limit=2)), 2)
+
+    def test_get_events_page(self):
+        first = self.event_reg.get_events_page(limit=4)
+        self.assertEqual([e.id for e in first.items], [1, 2, 3, 4])
+        second = self.event_reg.get_events_page(limit=4, cursor=first.next_cursor)
+        self.assertEqual([e.id for e in second.items], [5, 6])
+        self.assertIsNone(second.next_cursor)
+
+        # Pages resume after the last event seen, even if earlier events are added.
+        self.event_reg.create_event("Early Event", "Before all others", "2024-01-01", "09:00", "Room 1")
+        resumed = self.event_reg.get_events_page(limit=4, cursor=first.next_cursor)
+        self.assertEqual([e.id for e in resumed.items], [5, 6])
+
+        with self.assertRaises(ValueError):
+            self.event_reg.get_events_page(cursor="not-a-cursor")
+        with self.assertRaises(ValueError):
+            self.event_reg.get_events_page(limit=0)
+
     # Test User Registration Methods
     def test_validate_registration_data_valid(self):
         is_valid, message = self.event_reg.validate_registration_data(
@@ -75,6 +121,31 @@ class TestEventRegistration(unittest.TestCase):
         self.assertFalse(is_valid)
         self.assertEqual(message, "Invalid email format")
 
+    def test_validate_registration_data_phone_formats(self):
+        self.assertEqual(self.event_reg.validate_registration_data("John Doe", "john@example.com", "+1 (234) 567-8901"), (True, ""))
+        self.assertEqual(self.event_reg.validate_registration_data("John Doe", "john@example.com", "12345"),
+                         (False, "Phone number must be 10-15 digits"))
+
+    def test_validate_registration_batch(self):
+        codes = self.event_reg.validate_registration_batch([
+            ("John Doe", "john@example.com", "1234567890"),
+            ("", "john@example.com", "1234567890"),
+            ("John Doe", "john.example.com", "1234567890"),
+            ("John Doe", "john@example.com", "123"),
+        ])
+        self.assertEqual(codes, [None, ValidationCode.NAME_EMPTY, ValidationCode.EMAIL_INVALID,
+                                 ValidationCode.PHONE_LENGTH])
+
+    def test_parse_event_start(self):
+        self.assertEqual(parse_event_start("2024-06-15", "10:00"), datetime(2024, 6, 15, 10, 0))
+        self.assertEqual(parse_event_start("2024-6-5", "9:30"), datetime(2024, 6, 5, 9, 30))
+        with self.assertRaises(ValueError) as ctx:
+            parse_event_start("2024-02-30", "10:00")
+        self.assertEqual(ctx.exception.code, ValidationCode.DATE_INVALID)
+        with self.assertRaises(ValueError) as ctx:
+            parse_event_start("2024-02-10", "24:00")
+        self.assertEqual(ctx.exception.code, ValidationCode.TIME_INVALID)
+
     def test_register_user_for_event_success(self):
         success, message, user_id = self.event_reg.register_user_for_event(
             event_id=1,
@@ -138,6 +209,519 @@ class TestEventRegistration(unittest.TestCase):
         detailed_report = self.event_reg.get_detailed_report()
         self.assertEqual(detailed_report[0]["registrations"], 1)
 
+    def test_detailed_report_cached_until_change(self):
+        version = self.event_reg.report_version()
+        report = self.event_reg.get_detailed_report()
+        self.assertIs(self.event_reg.get_detailed_report(), report)
+        self.assertFalse(self.event_reg.has_changed_since(version))
+
+        _, _, user_id = self.event_reg.register_user_for_event(1, "John Doe", "john.doe@example.com", "1234567890")
+        self.assertTrue(self.event_reg.has_changed_since(version))
+        report = self.event_reg.get_detailed_report()
+        self.assertEqual(report[0]["registrations"], 1)
+
+        version = self.event_reg.report_version()
+        self.event_reg.delete_user_account(user_id)
+        self.assertTrue(self.event_reg.has_changed_since(version))
+        self.assertEqual(self.event_reg.get_detailed_report()[0]["registrations"], 0)
+
+    def test_find_user_by_email_case_insensitive(self):
+        _, _, user_id = self.event_reg.register_user_for_event(
+            event_id=1,
+            name="John Doe",
+            email="John.Doe@Example.com",
+            phone="1234567890"
+        )
+        self.assertEqual(self.event_reg.find_user_by_email("john.doe@example.com"), user_id)
+        self.assertTrue(self.event_reg.is_email_registered_for_event("JOHN.DOE@EXAMPLE.COM", 1))
+        self.assertFalse(self.event_reg.is_email_registered_for_event("john.doe@example.com", 2))
+
+    def test_find_user_by_email_after_delete(self):
+        _, _, user_id = self.event_reg.register_user_for_event(
+            event_id=1,
+            name="John Doe",
+            email="john.doe@example.com",
+            phone="1234567890"
+        )
+        self.event_reg.delete_user_account(user_id)
+        self.assertIsNone(self.event_reg.find_user_by_email("john.doe@example.com"))
+        self.assertFalse(self.event_reg.is_email_registered_for_event("john.doe@example.com", 1))
+
+    def test_get_event_registrants(self):
+        _, _, john_id = self.event_reg.register_user_for_event(1, "John Doe", "john.doe@example.com", "1234567890")
+        _, _, jane_id = self.event_reg.register_user_for_event(1, "Jane Doe", "jane.doe@example.com", "0987654321")
+        self.event_reg.register_user_for_event(2, "John Doe", "john.doe@example.com", "1234567890")
+        registrants = self.event_reg.get_event_registrants(1)
+        self.assertEqual([user.id for user in registrants], [john_id, jane_id])
+        self.assertEqual(self.event_reg.get_event_registration_count(1), 2)
+        self.assertEqual(self.event_reg.get_event_registration_count(2), 1)
+        self.assertIsNone(self.event_reg.get_event_registrants(999))
+
+    def test_get_event_registrants_page(self):
+        results = self.event_reg.bulk_register((1, f"User {i}", f"user{i}@example.com", "1234567890") for i in range(5))
+        user_ids = [user_id for _, _, user_id in results]
+        self.event_reg.delete_user_account(user_ids[1])
+
+        first = self.event_reg.get_event_registrants_page(1, limit=2)
+        self.assertEqual([u.id for u in first.items], [user_ids[0], user_ids[2]])
+        second = self.event_reg.get_event_registrants_page(1, limit=2, cursor=first.next_cursor)
+        self.assertEqual([u.id for u in second.items], user_ids[3:])
+        self.assertIsNone(second.next_cursor)
+        self.assertIsNone(self.event_reg.get_event_registrants_page(999))
+        # Cursors are tied to the listing they came from.
+        with self.assertRaises(ValueError):
+            self.event_reg.get_event_registrants_page(2, cursor=first.next_cursor)
+
+    def test_get_user_registrations_page(self):
+        for event_id in (6, 2, 4):
+            _, _, user_id = self.event_reg.register_user_for_event(event_id, "John Doe", "john.doe@example.com", "1234567890")
+        first = self.event_reg.get_user_registrations_page(user_id, limit=2)
+        self.assertEqual([e.id for e in first.items], [2, 4])
+        second = self.event_reg.get_user_registrations_page(user_id, limit=2, cursor=first.next_cursor)
+        self.assertEqual([e.id for e in second.items], [6])
+        self.assertIsNone(second.next_cursor)
+        self.assertIsNone(self.event_reg.get_user_registrations_page(999))
+
+    def test_registration_counts_after_delete(self):
+        _, _, john_id = self.event_reg.register_user_for_event(1, "John Doe", "john.doe@example.com", "1234567890")
+        self.event_reg.register_user_for_event(2, "John Doe", "john.doe@example.com", "1234567890")
+        self.event_reg.delete_user_account(john_id)
+        report = self.event_reg.get_registration_report()
+        self.assertEqual(report[1], 0)
+        self.assertEqual(report[2], 0)
+        self.assertEqual(self.event_reg.get_event_registrants(1), [])
+
+    def test_get_all_events_sorted_by_start(self):
+        early = self.event_reg.create_event("Early Event", "Before the samples", "2024-01-01", "08:00", "Hall A")
+        same_day = self.event_reg.create_event("Same Day Event", "Before event 1", "2024-06-15", "09:30", "Hall B")
+        events = self.event_reg.get_all_events()
+        self.assertEqual(len(events), 8)
+        self.assertEqual(events[0].id, early.id)
+        self.assertEqual(events[1].id, same_day.id)
+        self.assertEqual(events[2].id, 1)
+
+    def test_get_events_between(self):
+        events = self.event_reg.get_events_between(datetime(2024, 6, 20), datetime(2024, 7, 1))
+        self.assertEqual([event.id for event in events], [2, 3])
+        upcoming = self.event_reg.get_upcoming_events(days=7, now=datetime(2024, 6, 30, 12, 0))
+        self.assertEqual([event.id for event in upcoming], [4, 5])
+
+    def test_user_event_ids_behave_like_a_list(self):
+        _, _, user_id = self.event_reg.register_user_for_event(1, "John Doe", "john.doe@example.com", "1234567890")
+        self.event_reg.register_user_for_event(3, "John Doe", "john.doe@example.com", "1234567890")
+        user = self.event_reg.users[user_id]
+        self.assertEqual(user.event_ids, [1, 3])
+        self.assertNotEqual(user.event_ids, [3])
+        self.assertEqual(json.loads(json.dumps(asdict(user)))["event_ids"], [1, 3])
+
+    def test_get_user_registrations_sorted(self):
+        _, _, user_id = self.event_reg.register_user_for_event(3, "John Doe", "john.doe@example.com", "1234567890")
+        self.event_reg.register_user_for_event(1, "John Doe", "john.doe@example.com", "1234567890")
+        events = self.event_reg.get_user_registrations(user_id)
+        self.assertEqual([event.id for event in events], [1, 3])
+
+    def test_capacity_waitlist_and_promotion(self):
+        event = self.event_reg.create_event("Small Event", "Two seats", "2025-08-15", "12:00", "Room 1", capacity=2)
+        _, _, first_id = self.event_reg.register_user_for_event(event.id, "User 1", "user1@example.com", "1234567890")
+        self.event_reg.register_user_for_event(event.id, "User 2", "user2@example.com", "1234567890")
+        success, message, waiting_id = self.event_reg.register_user_for_event(
+            event.id, "User 3", "user3@example.com", "1234567890")
+        self.assertTrue(success)
+        self.assertEqual(message, "Event is full, added to the waitlist at position 1")
+        self.assertEqual(self.event_reg.get_event_registration_count(event.id), 2)
+        self.assertEqual([user.id for user in self.event_reg.get_event_waitlist(event.id)], [waiting_id])
+
+        success, message, _ = self.event_reg.register_user_for_event(
+            event.id, "User 3", "user3@example.com", "1234567890")
+        self.assertFalse(success)
+        self.assertEqual(message, "Email user3@example.com is already on the waitlist for this event")
+
+        self.event_reg.delete_user_account(first_id)
+        self.assertEqual(self.event_reg.get_event_registration_count(event.id), 2)
+        self.assertEqual(self.event_reg.get_event_waitlist(event.id), [])
+        self.assertTrue(self.event_reg.is_email_registered_for_event("user3@example.com", event.id))
+
+    def test_create_event_invalid_capacity(self):
+        with self.assertRaises(ValueError):
+            self.event_reg.create_event("Bad Event", "No seats", "2025-08-15", "12:00", "Room 1", capacity=0)
+
+    def test_bulk_register(self):
+        _, _, existing_id = self.event_reg.register_user_for_event(1, "John Doe", "john.doe@example.com", "1234567890")
+        results = self.event_reg.bulk_register([
+            {"event_id": "1", "name": "Jane Doe", "email": "jane.doe@example.com", "phone": "0987654321"},
+            (2, "Jane Doe", "JANE.DOE@example.com", "0987654321"),
+            (1, "Jane Again", "jane.doe@example.com", "0987654321"),
+            (1, "John Doe", "john.doe@example.com", "1234567890"),
+            (2, "John Doe", "john.doe@example.com", "1234567890"),
+            (999, "Nobody", "nobody@example.com", "1234567890"),
+            ("abc", "Nobody", "nobody@example.com", "1234567890"),
+            (1, "Bad Email", "bad-email", "1234567890"),
+        ])
+        self.assertEqual([success for success, _, _ in results],
+                         [True, True, False, False, True, False, False, False])
+        self.assertEqual(results[0][2], results[1][2])
+        self.assertEqual(results[4][2], existing_id)
+        self.assertEqual(results[3][1], "Email john.doe@example.com is already registered for this event")
+        self.assertEqual(results[5][1], "Event with ID 999 does not exist")
+        self.assertEqual(results[7][1], "Invalid email format")
+        self.assertEqual(self.event_reg.get_registration_report()[1], 2)
+        self.assertEqual(self.event_reg.get_registration_report()[2], 2)
+
+    def test_bulk_register_respects_capacity(self):
+        event = self.event_reg.create_event("Small Event", "Two seats", "2025-08-15", "12:00", "Room 1", capacity=2)
+        results = self.event_reg.bulk_register(
+            (event.id, f"User {i}", f"user{i}@example.com", "1234567890") for i in range(4))
+        self.assertEqual(results[3][1], "Event is full, added to the waitlist at position 2")
+        self.assertEqual(self.event_reg.get_event_registration_count(event.id), 2)
+        self.assertEqual(len(self.event_reg.get_event_waitlist(event.id)), 2)
+
+    def test_bulk_register_malformed_rows(self):
+        results = self.event_reg.bulk_register([
+            (1, "User 0", "user0@example.com", "1234567890"),
+            (1, "Ragged Row", "ragged@example.com"),
+            (1, "Number Phone", "number@example.com", 1234567890),
+            {"event_id": 1, "name": "User 1", "email": "user1@example.com", "phone": "1234567890"},
+        ])
+        self.assertEqual([success for success, _, _ in results], [True, False, False, True])
+        self.assertEqual(results[1], (False, "Invalid row: expected event_id, name, email and phone", -1))
+        self.assertEqual(results[2], (False, "Invalid row: name, email and phone must be text", -1))
+        self.assertEqual(self.event_reg.get_event_registration_count(1), 2)
+
+    def test_bulk_register_repeated_waitlisted_email(self):
+        event = self.event_reg.create_event("Full Event", "One seat", "2025-08-15", "12:00", "Room 1", capacity=1)
+        rows = [(event.id, "User 0", "user0@example.com", "1234567890"),
+                (event.id, "User 1", "user1@example.com", "1234567890"),
+                (event.id, "User 1", "USER1@example.com", "1234567890"),
+                (event.id, "User 0", "user0@example.com", "1234567890")]
+        results = self.event_reg.bulk_register(rows)
+        self.assertEqual(results[2], (False, "Email USER1@example.com is already on the waitlist for this event", -1))
+        self.assertEqual(results[3], (False, "Email user0@example.com is already registered for this event", -1))
+
+        one_at_a_time = EventRegistration()
+        event = one_at_a_time.create_event("Full Event", "One seat", "2025-08-15", "12:00", "Room 1", capacity=1)
+        self.assertEqual([one_at_a_time.register_user_for_event(*row) for row in rows], results)
+
+    def test_export_registrations_csv(self):
+        self.event_reg.bulk_register((1, f"User {i}", f"user{i}@example.com", "1234567890") for i in range(5))
+        batches = list(self.event_reg.iter_registrations(1, batch_size=2))
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+
+        out = io.StringIO()
+        self.assertEqual(self.event_reg.export_registrations(out, "csv", event_id=1, batch_size=2), 5)
+        lines = out.getvalue().splitlines()
+        self.assertEqual(lines[0], "event_id,event_name,user_id,name,email,phone")
+        self.assertTrue(lines[1].startswith("1,Event 1: AI Agentic Programming Workshop,"))
+        self.assertEqual(len(lines), 6)
+
+    def test_export_registrations_jsonl_all_events(self):
+        self.event_reg.register_user_for_event(1, "John Doe", "john.doe@example.com", "1234567890")
+        self.event_reg.register_user_for_event(3, "John Doe", "john.doe@example.com", "1234567890")
+        out = io.StringIO()
+        self.assertEqual(self.event_reg.export_registrations(out, "jsonl"), 2)
+        rows = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual([row["event_id"] for row in rows], [1, 3])
+        self.assertEqual(rows[0]["email"], "john.doe@example.com")
+
+        with self.assertRaises(ValueError):
+            self.event_reg.export_registrations(io.StringIO(), "xml")
+        with self.assertRaises(ValueError):
+            self.event_reg.iter_registrations(999)
+
+class TestRegistrationJournal(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def open_backend(self, snapshot_interval=1000):
+        journal = RegistrationJournal(self.tmpdir.name, snapshot_interval=snapshot_interval)
+        self.addCleanup(journal.close)
+        return EventRegistration(journal=journal)
+
+    def test_state_survives_restart(self):
+        backend = self.open_backend()
+        event = backend.create_event("Event 7: New Event", "A new test event", "2025-08-15", "12:00", "Test Venue")
+        _, _, john_id = backend.register_user_for_event(event.id, "John Doe", "john.doe@example.com", "1234567890")
+        _, _, jane_id = backend.register_user_for_event(1, "Jane Doe", "jane.doe@example.com", "0987654321")
+        backend.delete_user_account(jane_id)
+
+        restored = self.open_backend()
+        self.assertEqual(restored.get_event_by_id(event.id).name, "Event 7: New Event")
+        self.assertEqual(restored.find_user_by_email("john.doe@example.com"), john_id)
+        self.assertIsNone(restored.find_user_by_email("jane.doe@example.com"))
+        self.assertEqual(restored.get_registration_report()[event.id], 1)
+        _, _, new_id = restored.register_user_for_event(2, "Max Doe", "max.doe@example.com", "1234567890")
+        self.assertGreater(new_id, jane_id)
+
+    def test_snapshot_bounds_log(self):
+        backend = self.open_backend(snapshot_interval=3)
+        for i in range(7):
+            backend.register_user_for_event(1, f"User {i}", f"user{i}@example.com", "1234567890")
+        with open(os.path.join(self.tmpdir.name, RegistrationJournal.LOG_NAME)) as f:
+            self.assertEqual(len(f.readlines()), 1)
+
+        restored = self.open_backend(snapshot_interval=3)
+        self.assertEqual(restored.get_registration_report()[1], 7)
+
+    def test_waitlist_promotion_survives_restart(self):
+        backend = self.open_backend()
+        event = backend.create_event("Small Event", "One seat", "2025-08-15", "12:00", "Room 1", capacity=1)
+        _, _, first_id = backend.register_user_for_event(event.id, "User 1", "user1@example.com", "1234567890")
+        _, _, waiting_id = backend.register_user_for_event(event.id, "User 2", "user2@example.com", "1234567890")
+        backend.delete_user_account(first_id)
+
+        restored = self.open_backend()
+        self.assertEqual([user.id for user in restored.get_event_registrants(event.id)], [waiting_id])
+        self.assertEqual(restored.get_event_waitlist(event.id), [])
+
+    def test_bulk_register_survives_restart(self):
+        backend = self.open_backend()
+        backend.bulk_register((1, f"User {i}", f"user{i}@example.com", "1234567890") for i in range(5))
+        restored = self.open_backend()
+        self.assertEqual(restored.get_registration_report()[1], 5)
+
+def register_in_process(db_path, event_id, emails):
+    """Register emails for an event from a separate process sharing the database."""
+    storage = SQLiteStorage(db_path)
+    try:
+        backend = EventRegistration(storage=storage)
+        return [backend.register_user_for_event(event_id, "Worker User", email, "1234567890") for email in emails]
+    finally:
+        storage.close()
+
+class TestEventRegistrationSQLite(TestEventRegistration):
+    """Runs the EventRegistration tests against the SQLite storage backend."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.db_path = os.path.join(self.tmpdir.name, "registrations.db")
+        self.storage = SQLiteStorage(self.db_path)
+        self.addCleanup(self.storage.close)
+        self.event_reg = EventRegistration(storage=self.storage)
+
+    def test_state_shared_between_instances(self):
+        _, _, user_id = self.event_reg.register_user_for_event(1, "John Doe", "john.doe@example.com", "1234567890")
+        other_storage = SQLiteStorage(self.db_path)
+        self.addCleanup(other_storage.close)
+        other = EventRegistration(storage=other_storage)
+        self.assertEqual(len(other.get_all_events()), 6)
+        self.assertEqual(other.find_user_by_email("JOHN.DOE@example.com"), user_id)
+        success, message, _ = other.register_user_for_event(1, "John Doe", "john.doe@example.com", "1234567890")
+        self.assertFalse(success)
+        self.assertEqual(other.users.get(user_id).event_ids, [1])
+
+    def test_checks_consistent_across_processes(self):
+        event = self.event_reg.create_event("Hot Event", "Ten seats", "2025-08-15", "12:00", "Arena", capacity=10)
+        # Every worker tries the same 12 emails, so each email must succeed exactly once.
+        emails = [f"user{i}@example.com" for i in range(12)]
+        with multiprocessing.Pool(4) as pool:
+            results = pool.starmap(register_in_process, [(self.db_path, event.id, emails)] * 4)
+        successes = [result for worker in results for result in worker if result[0]]
+        self.assertEqual(len(successes), 12)
+        self.assertEqual(len({user_id for _, _, user_id in successes}), 12)
+        self.assertEqual(self.event_reg.get_event_registration_count(event.id), 10)
+        self.assertEqual(len(self.event_reg.get_event_waitlist(event.id)), 2)
+
+class TestConcurrentRegistration(unittest.TestCase):
+    def setUp(self):
+        self.event_reg = EventRegistration(thread_safe=True)
+
+    def run_threads(self, target, count):
+        barrier = threading.Barrier(count)
+        results = [None] * count
+
+        def worker(i):
+            barrier.wait()
+            results[i] = target(i)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_duplicate_email_registers_once(self):
+        results = self.run_threads(
+            lambda i: self.event_reg.register_user_for_event(1, "John Doe", "John.Doe@example.com", "1234567890"), 16)
+        self.assertEqual(sum(1 for success, _, _ in results if success), 1)
+        self.assertEqual(self.event_reg.get_event_registration_count(1), 1)
+        self.assertEqual(len(self.event_reg.users), 1)
+
+    def test_distinct_emails_get_distinct_ids(self):
+        results = self.run_threads(
+            lambda i: self.event_reg.register_user_for_event(i % 6 + 1, f"User {i}", f"user{i}@example.com", "1234567890"), 32)
+        self.assertTrue(all(success for success, _, _ in results))
+        self.assertEqual(len({user_id for _, _, user_id in results}), 32)
+        self.assertEqual(sum(self.event_reg.get_registration_report().values()), 32)
+
+    def test_ticket_drop_respects_capacity(self):
+        event = self.event_reg.create_event("Hot Event", "Ten seats", "2025-08-15", "12:00", "Arena", capacity=10)
+        results = self.run_threads(
+            lambda i: self.event_reg.register_user_for_event(event.id, f"User {i}", f"user{i}@example.com", "1234567890"), 32)
+        self.assertTrue(all(success for success, _, _ in results))
+        self.assertEqual(self.event_reg.get_event_registration_count(event.id), 10)
+        self.assertEqual(len(self.event_reg.get_event_waitlist(event.id)), 22)
+
+    def test_reads_during_account_deletion(self):
+        event = self.event_reg.create_event("Hot Event", "Fifty seats", "2025-08-15", "12:00", "Arena", capacity=50)
+        user_ids = [user_id for _, _, user_id in self.event_reg.bulk_register(
+            [(event.id, f"User {i}", f"user{i}@example.com", "1234567890") for i in range(200)])]
+        self.event_reg.bulk_register([(1, f"User {i}", f"user{i}@example.com", "1234567890") for i in range(200)])
+
+        def read(_):
+            while self.event_reg.users:
+                self.event_reg.get_event_registrants(event.id)
+                self.event_reg.get_event_registrants_page(1, limit=25)
+                self.event_reg.get_event_waitlist(event.id)
+                self.event_reg.get_user_registrations(user_ids[-1])
+
+        def delete(i):
+            for user_id in user_ids[i::4]:
+                self.event_reg.delete_user_account(user_id)
+
+        def work(i):
+            try:
+                read(i) if i >= 4 else delete(i)
+            except Exception as exc:
+                return exc
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            errors = [error for error in self.run_threads(work, 8) if error is not None]
+        finally:
+            sys.setswitchinterval(interval)
+        self.assertEqual(errors, [])
+        self.assertEqual(len(self.event_reg.users), 0)
+        self.assertEqual(self.event_reg.get_event_registrants(event.id), [])
+
+    def test_concurrent_event_creation(self):
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for _ in range(10):
+                self.event_reg = EventRegistration(thread_safe=True)
+                self.run_threads(lambda i: [self.event_reg.create_event(
+                    f"Event {i}-{n}", "Parallel", "2025-08-15", f"{n % 24:02d}:00", "Hall") for n in range(50)], 8)
+                self.assertEqual(len(self.event_reg.get_all_events()), len(self.event_reg.events))
+                self.assertEqual(len(self.event_reg.get_events_between(
+                    datetime(2025, 8, 15), datetime(2025, 8, 16))), 400)
+        finally:
+            sys.setswitchinterval(interval)
+
+    def test_promotion_while_promoted_user_registers(self):
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for trial in range(200):
+                event = self.event_reg.create_event("Small Event", "One seat", "2025-08-15", "12:00", "Room 1", capacity=1)
+                _, _, holder_id = self.event_reg.register_user_for_event(
+                    event.id, "Holder", f"holder{trial}@example.com", "1234567890")
+                _, _, waiting_id = self.event_reg.register_user_for_event(
+                    event.id, "Waiting", f"waiting{trial}@example.com", "1234567890")
+                self.run_threads(lambda i: self.event_reg.delete_user_account(holder_id) if i == 0 else
+                                 self.event_reg.register_user_for_event(
+                                     1, "Waiting", f"waiting{trial}@example.com", "1234567890"), 2)
+                self.assertEqual(sorted(self.event_reg.users[waiting_id].event_ids), sorted([1, event.id]))
+        finally:
+            sys.setswitchinterval(interval)
+
+class TestAsyncEventRegistration(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.async_reg = AsyncEventRegistration(EventRegistration(thread_safe=True), max_batch=16)
+
+    async def asyncTearDown(self):
+        await self.async_reg.aclose()
+
+    async def test_concurrent_registrations_are_group_committed(self):
+        event = await self.async_reg.create_event("Ticket Drop", "Few seats", "2025-08-15", "12:00", "Arena", capacity=10)
+        results = await asyncio.gather(*(
+            self.async_reg.register_user_for_event(event.id, f"User {i}", f"user{i}@example.com", "1234567890")
+            for i in range(50)))
+        self.assertTrue(all(success for success, _, _ in results))
+        self.assertEqual(len({user_id for _, _, user_id in results}), 50)
+        self.assertEqual((await self.async_reg.get_registration_report())[event.id], 10)
+        self.assertEqual(results[-1][1], "Event is full, added to the waitlist at position 40")
+
+    async def test_duplicate_and_invalid_registrations(self):
+        results = await asyncio.gather(
+            self.async_reg.register_user_for_event(1, "John Doe", "john.doe@example.com", "1234567890"),
+            self.async_reg.register_user_for_event(1, "John Doe", "JOHN.DOE@example.com", "1234567890"),
+            self.async_reg.register_user_for_event(1, "Bad Email", "bad-email", "1234567890"),
+            self.async_reg.register_user_for_event(999, "John Doe", "john.doe@example.com", "1234567890"))
+        self.assertEqual([success for success, _, _ in results], [True, False, False, False])
+        self.assertEqual(results[2][1], "Invalid email format")
+
+        user_id = results[0][2]
+        self.assertEqual([e.id for e in await self.async_reg.get_user_registrations(user_id)], [1])
+        self.assertEqual(await self.async_reg.find_user_by_email("john.doe@example.com"), user_id)
+        self.assertEqual((await self.async_reg.delete_user_account(user_id))[0], True)
+        self.assertEqual((await self.async_reg.get_detailed_report())[0]["registrations"], 0)
+
+    def test_requires_thread_safe_backend(self):
+        with self.assertRaises(ValueError):
+            AsyncEventRegistration(EventRegistration())
+
+class TestRegistrationTemplates(unittest.TestCase):
+    def setUp(self):
+        self.event_reg = EventRegistration()
+
+    def test_event_card_cached_until_event_changes(self):
+        event = self.event_reg.get_event_by_id(1)
+        rendered = []
+        cache = registration_templates.FragmentCache(lambda e: rendered.append(e.id) or e.name)
+        cache.get(event.id, registration_templates.event_stamp(event), event)
+        cache.get(event.id, registration_templates.event_stamp(event), event)
+        self.assertEqual(rendered, [1])
+        event.name = "Renamed Event"
+        self.assertEqual(cache.get(event.id, registration_templates.event_stamp(event), event), "Renamed Event")
+        self.assertEqual(rendered, [1, 1])
+
+    def test_pages_escape_values(self):
+        event = self.event_reg.create_event("<script>alert(1)</script>", "Desc & more", "2025-08-15", "12:00",
+                                            "Room 1", capacity=5)
+        page = registration_templates.render_event_page(event, 2, False)
+        self.assertIn("&lt;script&gt;", page)
+        self.assertIn("2 / 5 taken", page)
+        home = registration_templates.render_home_page("Upcoming Events", self.event_reg.get_all_events())
+        self.assertNotIn("<script>", home)
+        self.assertEqual(home.count("button below to register"), 7)
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def test_run_suite_is_json_serializable(self):
+        results = run_suite(users=50, events=5, samples=20, memory=False)
+        self.assertEqual(results["config"]["users"], 50)
+        self.assertIn("p99_us", results["lookup_latency"]["find_user_by_email"])
+        self.assertGreater(results["registration"]["bulk_per_s"], 0)
+        json.dumps(results)
+
+class TestRegistrationMetrics(unittest.TestCase):
+    def setUp(self):
+        self.metrics = RegistrationMetrics(slow_threshold=10.0)
+        self.event_reg = EventRegistration(metrics=self.metrics)
+
+    def test_counts_calls_and_errors(self):
+        self.event_reg.register_user_for_event(1, "John Doe", "john.doe@example.com", "1234567890")
+        self.event_reg.get_detailed_report()
+        with self.assertRaises(ValueError):
+            self.event_reg.create_event("Bad Event", "Bad date", "2025-13-45", "10:00", "Room 1")
+        methods = self.metrics.snapshot()["methods"]
+        self.assertEqual(methods["register_user_for_event"]["calls"], 1)
+        self.assertEqual(methods["create_event"]["errors"], 1)
+        self.assertEqual(methods["get_detailed_report"]["buckets"][-1][1], 1)
+        self.assertNotIn("register_user_for_event", vars(EventRegistration()))
+
+    def test_slow_calls_and_prometheus_text(self):
+        metrics = RegistrationMetrics(slow_threshold=0.0)
+        event_reg = EventRegistration(metrics=metrics)
+        with self.assertLogs("event_registration.slow_calls", level="WARNING"):
+            event_reg.get_all_events()
+        self.assertEqual(metrics.snapshot()["slow_calls"][0]["method"], "get_all_events")
+        text = metrics.to_prometheus()
+        self.assertIn('ezregistration_calls_total{method="get_all_events"} 1', text)
+        self.assertIn('ezregistration_call_duration_seconds_bucket{method="get_all_events",le="+Inf"} 1', text)
+
 if __name__ == '__main__':
     unittest.main()
 ```